@@ -18,26 +18,22 @@ Credentials:
 
 import asyncio
 import logging
+import time
+from typing import Optional
+
 from livekit import agents
-from livekit.agents import AgentSession, Agent, RoomInputOptions
-from livekit.plugins import silero, noise_cancellation
+from livekit.agents import AgentSession, Agent, JobExecutorType, RoomInputOptions, metrics
+from livekit.plugins import noise_cancellation
 
-from src.config import config
+from src.config import DRAIN_END_MARGIN_SECONDS, config
 from src.api_client import NestJSClient
-from src.interview_orchestrator import InterviewOrchestrator
-
-# Try to import providers - we'll use what's available
-try:
-    from livekit.plugins import deepgram
-    DEEPGRAM_AVAILABLE = True
-except ImportError:
-    DEEPGRAM_AVAILABLE = False
-
-try:
-    from livekit.plugins import google
-    GOOGLE_AVAILABLE = True
-except ImportError:
-    GOOGLE_AVAILABLE = False
+from src.interview_orchestrator import InterviewOrchestrator, RESOURCE_LIMIT_END_MESSAGE
+from src.diagnostics import WorkerReadiness
+from src.loop_monitor import LoopMonitor, TaskRegistry
+from src.providers import create_speech_providers, load_vad
+from src.resource_accounting import SessionResources
+from src.session_recorder import SessionRecorder
+from src.worker_drain import install_drain_forwarding, on_worker_drain
 
 
 # Configure logging only if no handlers exist (avoid duplicate logs)
@@ -49,7 +45,48 @@ if not logging.getLogger().hasHandlers():
     )
 logger.setLevel(config.log_level)
 
-server = agents.AgentServer()
+# Report full load (no interviews dispatched) until the worker has started and
+# the backend is reachable
+readiness = WorkerReadiness(
+    config.nestjs_api_url,
+    check_interval=config.backend_check_interval,
+    default_load=agents.WorkerOptions.load_fnc,
+)
+
+# On SIGTERM the worker stops accepting jobs and waits up to this long for them to finish
+server = agents.AgentServer(
+    drain_timeout=config.worker_drain_timeout,
+    job_memory_warn_mb=config.job_memory_warn_mb,
+    job_memory_limit_mb=config.job_memory_limit_mb,
+    load_fnc=readiness.load,
+)
+
+# How long teardown waits for in-flight submit_answer/complete_interview calls
+BACKEND_FLUSH_TIMEOUT_SECONDS = 30.0
+
+# When a draining interview is ended early (None = the worker has no drain timeout)
+DRAIN_DEADLINE_SECONDS: Optional[float] = (
+    config.worker_drain_timeout - DRAIN_END_MARGIN_SECONDS if config.worker_drain_timeout else None
+)
+
+
+@server.on("worker_started")
+def on_worker_started():
+    readiness.mark_started()
+    # Job processes ignore SIGTERM - forward it so running interviews know we are draining
+    install_drain_forwarding(
+        server, timeout=config.worker_drain_timeout, on_drain=readiness.mark_draining
+    )
+
+
+def prewarm(proc: agents.JobProcess):
+    """Load the VAD model once per worker process instead of once per interview."""
+    start = time.perf_counter()
+    proc.userdata["vad"] = load_vad()
+    logger.info(f"Prewarm: VAD loaded in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+
+server.setup_fnc = prewarm
 
 
 class InterviewAgent(Agent):
@@ -68,7 +105,6 @@ Wait for explicit instructions before speaking."""
 
         super().__init__(instructions=instructions)
         self.orchestrator = orchestrator
-        self._tasks = set()
 
 
 @server.rtc_session()
@@ -77,6 +113,49 @@ async def entrypoint(ctx: agents.JobContext):
     logger.info(f"Agent joining room {ctx.room.name}")
     
     nestjs_client = NestJSClient(config.nestjs_api_url)
+    tasks = TaskRegistry(ctx.room.name)
+    loop_monitor = LoopMonitor(
+        sample_interval=config.loop_monitor_interval,
+        stall_threshold=config.loop_stall_threshold,
+        log_interval=config.loop_stats_log_interval,
+    )
+    loop_monitor.register(tasks)
+    loop_monitor.start()
+    recorder = SessionRecorder.for_room(config.session_recording_dir, ctx.room.name)
+    recorder.record("start", room=ctx.room.name)
+    orchestrator: Optional[InterviewOrchestrator] = None
+    drain_requested = asyncio.Event()
+    
+    def request_drain():
+        if not drain_requested.is_set():
+            logger.info(f"Drain requested for room {ctx.room.name}")
+            drain_requested.set()
+    
+    end_requested = asyncio.Event()
+    end_reason: list[str] = []
+    
+    def request_end(reason: str):
+        if not end_requested.is_set():
+            logger.warning(f"Ending session for room {ctx.room.name}: {reason}")
+            end_reason.append(reason)
+            end_requested.set()
+    
+    # The worker forwards SIGTERM to jobs when it starts draining
+    stop_drain_listener = on_worker_drain(
+        request_drain, in_process=ctx.proc.executor_type == JobExecutorType.PROCESS
+    )
+    
+    resources = SessionResources(
+        tasks,
+        max_transcript_bytes=config.session_max_transcript_bytes,
+        max_data_bytes=config.session_max_data_bytes,
+        max_tasks=config.session_max_tasks,
+        max_allocated_mb=config.session_max_allocated_mb,
+        track_allocations=config.session_tracemalloc,
+        end_session_on_limit=config.session_limit_action == "end",
+        on_limit_exceeded=lambda reason: request_end(f"resource limit: {reason}"),
+    )
+    resources.start()
     
     try:
         await ctx.connect()
@@ -88,6 +167,8 @@ async def entrypoint(ctx: agents.JobContext):
             session=None,  # Will be set later
             room_name=ctx.room.name,
             room=ctx.room,
+            tasks=tasks,
+            recorder=recorder,
         )
         
         # Initialize to get interview questions
@@ -106,70 +187,13 @@ async def entrypoint(ctx: agents.JobContext):
         # We intentionally DO NOT include LLM to prevent automatic responses
         # All speech output is controlled via session.say() by the orchestrator
         
-        # Determine STT provider based on available credentials
-        stt_instance = None
-        tts_instance = None
-        
-        # Priority: Deepgram (API key auth) > Google (service account auth)
-        if config.deepgram_api_key and DEEPGRAM_AVAILABLE:
-            logger.info("Using Deepgram STT and TTS")
-            stt_instance = deepgram.STT(
-                api_key=config.deepgram_api_key,
-                model="nova-2",
-                language="en",
-            )
-            tts_instance = deepgram.TTS(
-                api_key=config.deepgram_api_key,
-                model="aura-asteria-en",  # Female voice, natural sounding
-            )
-        elif config.google_credentials_file and GOOGLE_AVAILABLE:
-            logger.info(f"Using Google STT/TTS with credentials file: {config.google_credentials_file}")
-            stt_instance = google.STT(
-                credentials_file=config.google_credentials_file,
-                model=config.stt_model,
-                languages=[config.stt_language],
-                spoken_punctuation=True,
-            )
-            tts_instance = google.TTS(
-                credentials_file=config.google_credentials_file,
-                voice_name=config.tts_voice,
-                language=config.tts_language,
-            )
-        elif GOOGLE_AVAILABLE:
-            # Try Google with Application Default Credentials
-            logger.info("Attempting Google STT/TTS with Application Default Credentials")
-            try:
-                stt_instance = google.STT(
-                    model=config.stt_model,
-                    languages=[config.stt_language],
-                    spoken_punctuation=True,
-                )
-                tts_instance = google.TTS(
-                    voice_name=config.tts_voice,
-                    language=config.tts_language,
-                )
-            except ValueError as e:
-                logger.error(f"Google STT/TTS initialization failed: {e}")
-                logger.error(
-                    "Please set DEEPGRAM_API_KEY (recommended), "
-                    "or set GOOGLE_APPLICATION_CREDENTIALS to a service account JSON file, "
-                    "or run 'gcloud auth application-default login'."
-                )
-                raise
-        else:
-            raise RuntimeError(
-                "No STT/TTS provider available. Please set DEEPGRAM_API_KEY or configure Google Cloud credentials."
-            )
+        stt_instance, tts_instance = create_speech_providers()
         
         session = AgentSession(
             stt=stt_instance,
             tts=tts_instance,
-            # VAD for turn detection - longer silence for interviews
-            vad=silero.VAD.load(
-                min_speech_duration=0.5,
-                min_silence_duration=3.0,  # Wait 3 seconds before considering turn complete
-                prefix_padding_duration=0.5,
-            ),
+            # VAD for turn detection - preloaded per process by prewarm()
+            vad=ctx.proc.userdata.get("vad") or load_vad(),
         )
         
         # Update orchestrator with session
@@ -178,6 +202,10 @@ async def entrypoint(ctx: agents.JobContext):
             session=session,
             room_name=ctx.room.name,
             room=ctx.room,
+            tasks=tasks,
+            recorder=recorder,
+            early_answer_capture=config.early_answer_capture,
+            resources=resources,
         )
         orchestrator.interview_data = interview_data
         orchestrator.questions = questions
@@ -190,21 +218,35 @@ async def entrypoint(ctx: agents.JobContext):
         @session.on("agent_state_changed")
         def on_agent_state_changed(ev):
             logger.debug(f"Agent state changed: {ev}")
+            recorder.record("agent_state", old=str(ev.old_state), new=str(ev.new_state))
         
         @session.on("user_state_changed")
         def on_user_state_changed(ev):
             logger.debug(f"User state changed: {ev}")
+            recorder.record("user_state", old=str(ev.old_state), new=str(ev.new_state))
+        
+        @session.on("metrics_collected")
+        def on_metrics_collected(ev):
+            # Log loop stats next to TTS/STT metrics to correlate glitches with stalls
+            if isinstance(ev.metrics, (metrics.TTSMetrics, metrics.STTMetrics)):
+                timings = ev.metrics.model_dump(
+                    include={"ttfb", "duration", "audio_duration", "characters_count"}
+                )
+                loop_stats = loop_monitor.snapshot()
+                logger.info(f"{ev.metrics.type}: {timings}, loop: {loop_stats}")
+                recorder.record("metrics", metric=ev.metrics.type, **timings, loop=loop_stats)
+            else:
+                logger.debug(f"Metrics: {ev.metrics}")
         
         @session.on("user_input_transcribed")
         def on_user_input_transcribed(ev):
             """Handle transcribed user speech - pass to orchestrator for debouncing."""
             if hasattr(ev, 'transcript') and ev.transcript:
                 logger.info(f"User said: {ev.transcript[:100]}...")
-                task = asyncio.create_task(
-                    orchestrator.on_user_speech_committed(ev.transcript)
+                tasks.create_task(
+                    orchestrator.on_user_speech_committed(ev.transcript),
+                    name="user-speech",
                 )
-                agent._tasks.add(task)
-                task.add_done_callback(agent._tasks.discard)
         
         # Start the session - no agent needed since we don't use LLM
         # We pass agent=None to prevent automatic LLM responses
@@ -216,11 +258,6 @@ async def entrypoint(ctx: agents.JobContext):
             ),
         )
         
-        logger.info("Session started, beginning interview...")
-        await asyncio.sleep(1)
-        await orchestrator.start_interview(session)
-        
-        # Wait until disconnected
         disconnect_event = asyncio.Event()
         
         @ctx.room.on("disconnected")
@@ -228,13 +265,54 @@ async def entrypoint(ctx: agents.JobContext):
             logger.info(f"Room disconnected: {reason}")
             disconnect_event.set()
         
-        await disconnect_event.wait()
+        logger.info("Session started, beginning interview...")
+        await asyncio.sleep(1)
+        await orchestrator.start_interview(session)
+        
+        # Wait until disconnected, asked to drain or the session has to end
+        disconnected = tasks.create_task(disconnect_event.wait(), name="wait-disconnect")
+        drain = tasks.create_task(drain_requested.wait(), name="wait-drain")
+        end = tasks.create_task(end_requested.wait(), name="wait-end")
+        waiters = [disconnected, drain, end]
+        await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        
+        if drain.done() and not (disconnected.done() or end.done()):
+            # Keep interviewing until the end (or the drain deadline), then leave
+            draining = tasks.create_task(
+                orchestrator.drain(DRAIN_DEADLINE_SECONDS), name="drain-interview"
+            )
+            waiters.append(draining)
+            await asyncio.wait([disconnected, draining, end], return_when=asyncio.FIRST_COMPLETED)
+            if draining.done():
+                ctx.shutdown(reason="drained")
+        
+        if end.done() and not disconnected.done():
+            # Over budget - tell the candidate, keep what they said, and leave
+            reason = end_reason[0]
+            await orchestrator.end_early(reason, RESOURCE_LIMIT_END_MESSAGE)
+            await orchestrator.flush_backend_calls(timeout=BACKEND_FLUSH_TIMEOUT_SECONDS)
+            ctx.shutdown(reason=reason)
+        for waiter in waiters:
+            waiter.cancel()
         
     except Exception as e:
         logger.error(f"Agent runtime error: {e}", exc_info=True)
     finally:
         logger.info("Cleaning up agent resources")
+        if orchestrator:
+            await orchestrator.flush_backend_calls(timeout=BACKEND_FLUSH_TIMEOUT_SECONDS)
+        await resources.stop()
+        leaked = await tasks.shutdown()
+        loop_monitor.unregister(tasks)
+        logger.info(
+            f"Session loop stats: {loop_monitor.snapshot()}, "
+            f"tasks spawned: {tasks.spawned_count}, leaked: {len(leaked)}"
+        )
+        logger.info(f"Session resource usage: {resources.snapshot()}")
+        await loop_monitor.stop()
+        recorder.close()
         await nestjs_client.close()
+        stop_drain_listener()
         logger.info("Interview agent session ended")
 
 
@@ -0,0 +1,57 @@
+"""
+Startup diagnostics for the interview agent.
+
+Measures per-module import time, config load, Silero VAD load, STT/TTS
+provider construction and the HTTP round-trip to the NestJS backend, and
+prints the results as JSON. Exits with status 1 if a required check fails.
+
+Usage:
+    uv run python diagnose.py                     # one-shot JSON report
+    uv run python diagnose.py --stand-in          # time HTTP against a local stand-in backend
+    uv run python diagnose.py --url http://backend:3001/api
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+
+from src.diagnostics import run_startup_profile, start_stand_in_backend
+
+
+async def profile(url: str | None, stand_in: bool) -> dict:
+    """Run the startup profile, optionally against a local stand-in backend."""
+    # Also import the agent module itself, as the worker does. It loads the
+    # config at import, so it goes after the config check to keep that timed
+    after_checks = ("agent",)
+    if not stand_in:
+        return await run_startup_profile(url, modules_after_checks=after_checks)
+
+    server, stand_in_url = await start_stand_in_backend()
+    async with server:
+        return await run_startup_profile(stand_in_url, modules_after_checks=after_checks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Interview agent startup diagnostics")
+    parser.add_argument("--url", help="backend URL to probe (default: NESTJS_API_URL)")
+    parser.add_argument(
+        "--stand-in", action="store_true", help="probe a local stand-in instead of the backend"
+    )
+    args = parser.parse_args()
+
+    # Logs go to stderr so stdout stays valid JSON
+    logging.basicConfig(
+        level=logging.WARNING,
+        stream=sys.stderr,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    report = asyncio.run(profile(args.url, args.stand_in))
+    print(json.dumps(report, indent=2))
+    sys.exit(0 if report["ok"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,404 @@
+"""
+Replay a recorded interview session through InterviewOrchestrator.
+
+Feeds the transcripts of a SESSION_RECORDING_DIR log back through the
+orchestrator using fake session, room and backend objects that reproduce
+the recorded playout durations and backend latencies, then prints the
+per-question turn timings of the recording and of the replay as JSON.
+
+User speech is replayed relative to the turn it belongs to, so changes to
+debounce or pacing shift later turns the same way they would in a real
+conversation: speech during a question's playout relative to the question,
+speech after it relative to the answer window.
+
+By default the replay runs on a virtual clock that jumps straight to the
+next scheduled timer, so a 20 minute interview replays in well under a
+second and produces the same timings on every run. Use --realtime to
+replay at wall-clock speed.
+
+With --early-answers each recording is replayed twice, with early answer
+capture off and on, and the total interview wall-time saved is reported.
+In a recording made without early answer capture, speech during playout
+was ignored and candidates repeat it once the question ends. With capture
+on that speech is kept and interrupts the question, so the replay drops
+the repeated words (keeping any new ones) and moves the rest of the answer
+up by the time they took.
+
+Usage:
+    uv run python replay_session.py recordings/interview-<id>-<ts>.jsonl
+    uv run python replay_session.py recordings/interview-<id>-<ts>.jsonl --realtime
+    uv run python replay_session.py recordings/*.jsonl --early-answers
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import selectors
+from collections import Counter, defaultdict, deque
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Optional
+
+from src.interview_orchestrator import InterviewOrchestrator
+from src.models import decode_interview
+from src.session_recorder import SessionRecorder, compute_turn_timings, load_events
+
+logger = logging.getLogger(__name__)
+
+# Speaking rate used for utterances that do not appear in the recording
+WORDS_PER_SECOND = 2.5
+
+# Share of an utterance's words already said during playout for it to count as a repetition
+REPEAT_WORD_OVERLAP = 0.5
+
+
+class _VirtualClockSelector(selectors.DefaultSelector):
+    """Selector that skips ahead in virtual time instead of blocking."""
+
+    def __init__(self, loop: "VirtualTimeEventLoop"):
+        super().__init__()
+        self._loop = loop
+
+    def select(self, timeout: Optional[float] = None):
+        if timeout is None:
+            # Nothing scheduled - only I/O (e.g. call_soon_threadsafe) can wake us
+            return super().select(None)
+        events = super().select(0)
+        if not events and timeout > 0:
+            self._loop.advance(timeout)
+        return events
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """Event loop whose clock jumps straight to the next scheduled timer."""
+
+    def __init__(self):
+        self._now = 0.0
+        super().__init__(_VirtualClockSelector(self))
+
+    def time(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float):
+        self._now += seconds
+
+
+class FakeSession:
+    """Stands in for AgentSession - 'plays' each utterance for its recorded duration.
+
+    Only full playout durations are reused. An interrupted utterance (or an
+    interruptible one from a recording that predates the interrupted flag)
+    is timed with the WORDS_PER_SECOND estimate instead.
+    """
+
+    def __init__(self, events: list[dict[str, Any]]):
+        self._interrupt: Optional[asyncio.Event] = None
+        self._durations: dict[str, deque[Optional[float]]] = defaultdict(deque)
+        for event in events:
+            if event["type"] == "say":
+                full_playout = not event.get("interruptible") or event.get("interrupted") is False
+                self._durations[" ".join(event["text"].split())].append(
+                    event["duration"] if full_playout else None
+                )
+
+    async def say(self, text: str, allow_interruptions: bool = True) -> SimpleNamespace:
+        """Returns a stand-in for the SpeechHandle, with whether playout was interrupted."""
+        durations = self._durations.get(" ".join(text.split()))
+        duration = durations.popleft() if durations else None
+        if duration is None:
+            duration = len(text.split()) / WORDS_PER_SECOND
+
+        if not allow_interruptions:
+            await asyncio.sleep(duration)
+            return SimpleNamespace(interrupted=False)
+        self._interrupt = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._interrupt.wait(), duration)
+            return SimpleNamespace(interrupted=True)
+        except asyncio.TimeoutError:
+            return SimpleNamespace(interrupted=False)
+        finally:
+            self._interrupt = None
+
+    def interrupt(self):
+        """Stop interruptible playout, as user speech does in AgentSession."""
+        if self._interrupt:
+            self._interrupt.set()
+
+
+class _FakeParticipant:
+    def __init__(self):
+        self.published: list[bytes] = []
+
+    async def publish_data(self, payload: bytes, **kwargs: Any):
+        self.published.append(payload)
+
+
+class FakeRoom:
+    """Stands in for the LiveKit Room - collects data channel messages."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.local_participant = _FakeParticipant()
+
+
+class FakeNestJSClient:
+    """Answers backend calls with the recorded interview data and latencies."""
+
+    def __init__(self, events: list[dict[str, Any]]):
+        self._interview = next((e["data"] for e in events if e["type"] == "interview"), None)
+        self._latencies: dict[str, deque[float]] = defaultdict(deque)
+        for event in events:
+            if event["type"] == "backend":
+                self._latencies[event["call"]].append(event["latency"])
+
+    async def _wait(self, call: str):
+        latencies = self._latencies[call]
+        await asyncio.sleep(latencies.popleft() if latencies else 0.0)
+
+    async def get_interview_details(self, interview_id: str, room_name: str):
+        await self._wait("get_interview_details")
+        return decode_interview(self._interview) if self._interview else None
+
+    async def submit_answer(self, question_id: str, transcript: str, duration: float):
+        await self._wait("submit_answer")
+        return {"question_id": question_id}
+
+    async def complete_interview(self, interview_id: str, room_name: str) -> bool:
+        await self._wait("complete_interview")
+        return True
+
+    async def close(self):
+        pass
+
+
+class ReplayRecorder(SessionRecorder):
+    """In-memory recorder that reports orchestrator milestones to the replay driver."""
+
+    def __init__(self, on_event: Callable[[str, dict[str, Any]], None]):
+        super().__init__(clock=asyncio.get_running_loop().time)
+        self._on_event = on_event
+
+    def record(self, kind: str, t: Optional[float] = None, **fields: Any):
+        super().record(kind, t=t, **fields)
+        self._on_event(kind, fields)
+
+
+class SessionReplay:
+    """Drives an InterviewOrchestrator with the user speech from a recording."""
+
+    def __init__(self, events: list[dict[str, Any]], early_answer_capture: bool = False):
+        self.events = events
+        self.early_answer_capture = early_answer_capture
+        self.session: Optional[FakeSession] = None
+        self.room_name = next(
+            (e["room"] for e in events if e["type"] == "start"), "interview-replay"
+        )
+        self.orchestrator: Optional[InterviewOrchestrator] = None
+        self._done: Optional[asyncio.Event] = None
+
+        # Speech during a question's playout is replayed relative to the question,
+        # later speech relative to the answer window, anything earlier (e.g. during
+        # the greeting) relative to the session start
+        question_start = {e["index"]: e["t"] for e in events if e["type"] == "question"}
+        window_start = {e["index"]: e["t"] for e in events if e["type"] == "answer_window"}
+        self._from_start: list[tuple[float, str]] = []
+        self._during_question: dict[int, list[tuple[float, str]]] = defaultdict(list)
+        self._after_window: dict[int, list[tuple[float, str]]] = defaultdict(list)
+        for event in events:
+            if event["type"] != "transcript":
+                continue
+            index = event["index"]
+            asked = question_start.get(index)
+            window = window_start.get(index)
+            if asked is None or event["t"] < asked:
+                self._from_start.append((event["t"], event["text"]))
+            elif window is None or event["t"] < window:
+                self._during_question[index].append((event["t"] - asked, event["text"]))
+            else:
+                self._after_window[index].append((event["t"] - window, event["text"]))
+
+        if early_answer_capture:
+            for index, during in self._during_question.items():
+                self._after_window[index] = _drop_repeated_speech(
+                    " ".join(text for _, text in during), self._after_window[index]
+                )
+
+    def _deliver(self, text: str):
+        """Hand a transcript to the orchestrator the same way agent.py does."""
+        self.session.interrupt()
+        self.orchestrator.tasks.create_task(
+            self.orchestrator.on_user_speech_committed(text), name="user-speech"
+        )
+
+    def _on_event(self, kind: str, fields: dict[str, Any]):
+        loop = asyncio.get_running_loop()
+        if kind == "question":
+            for offset, text in self._during_question.pop(fields["index"], []):
+                loop.call_later(offset, self._deliver, text)
+        elif kind == "answer_window":
+            for offset, text in self._after_window.pop(fields["index"], []):
+                loop.call_later(offset, self._deliver, text)
+        elif kind == "complete":
+            self._done.set()
+
+    async def run(self, timeout: Optional[float] = None) -> list[dict[str, Any]]:
+        """Replay the session and return the replayed event log."""
+        loop = asyncio.get_running_loop()
+        self._done = asyncio.Event()
+        recorder = ReplayRecorder(self._on_event)
+        recorder.record("start", room=self.room_name)
+
+        self.session = session = FakeSession(self.events)
+        self.orchestrator = InterviewOrchestrator(
+            nestjs_client=FakeNestJSClient(self.events),
+            session=session,
+            room_name=self.room_name,
+            room=FakeRoom(self.room_name),
+            recorder=recorder,
+            early_answer_capture=self.early_answer_capture,
+        )
+        if not await self.orchestrator.initialize():
+            raise RuntimeError("Recording does not contain usable interview data")
+
+        for t, text in self._from_start:
+            loop.call_later(max(0.0, t - recorder.elapsed()), self._deliver, text)
+
+        if timeout is None:
+            recorded_length = max((e["t"] for e in self.events), default=0.0)
+            timeout = recorded_length * 3 + 300
+
+        await self.orchestrator.start_interview(session)
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Replay did not complete within {timeout:.0f}s")
+        await self.orchestrator.tasks.shutdown()
+        return recorder.events
+
+
+def _words(text: str) -> list[str]:
+    return [word.strip(".,;:!?\"'").lower() for word in text.split()]
+
+
+def _drop_repeated_speech(
+    said_during_playout: str, after_window: list[tuple[float, str]]
+) -> list[tuple[float, str]]:
+    """Drop words repeated from playout and move the rest of the answer up.
+
+    Leading utterances that mostly repeat what was said during playout lose
+    their repeated words only; their new words are kept. The time saved is
+    the repeated share of each such utterance's span, and later speech moves
+    up by the total.
+    """
+    unused = Counter(_words(said_during_playout))
+    shift = 0.0
+    previous = 0.0
+    kept: list[tuple[float, str]] = []
+    for position, (offset, text) in enumerate(after_window):
+        tokens = text.split()
+        words = _words(text)
+        if not words or sum(unused[word] > 0 for word in words) / len(words) < REPEAT_WORD_OVERLAP:
+            kept.extend((max(0.0, o - shift), t) for o, t in after_window[position:])
+            break
+        new_words = []
+        for token, word in zip(tokens, words):
+            if unused[word] > 0:
+                unused[word] -= 1
+            else:
+                new_words.append(token)
+        shift += (offset - previous) * (len(words) - len(new_words)) / len(words)
+        previous = offset
+        if new_words:
+            kept.append((max(0.0, offset - shift), " ".join(new_words)))
+    return kept
+
+
+def summarize(events: list[dict[str, Any]]) -> dict[str, Any]:
+    """Total interview time and per-question turn timings for an event log."""
+    turns = compute_turn_timings(events)
+    end = next((e["t"] for e in reversed(events) if e["type"] == "complete"), None)
+    return {"total_seconds": end, "turns": turns}
+
+
+def run_replay(
+    events: list[dict[str, Any]],
+    realtime: bool = False,
+    early_answer_capture: bool = False,
+) -> list[dict[str, Any]]:
+    """Replay a recording on a wall-clock or virtual-time event loop."""
+    replay = SessionReplay(events, early_answer_capture=early_answer_capture)
+    if realtime:
+        return asyncio.run(replay.run())
+
+    loop = VirtualTimeEventLoop()
+    try:
+        return loop.run_until_complete(replay.run())
+    finally:
+        loop.close()
+
+
+def _savings(baseline_seconds: float, early_seconds: float) -> dict[str, Any]:
+    saved = baseline_seconds - early_seconds
+    return {
+        "baseline_seconds": round(baseline_seconds, 3),
+        "early_answer_seconds": round(early_seconds, 3),
+        "saved_seconds": round(saved, 3),
+        "saved_percent": round(100 * saved / baseline_seconds, 1) if baseline_seconds else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded interview session")
+    parser.add_argument(
+        "recordings", type=Path, nargs="+", help="JSON Lines files from SESSION_RECORDING_DIR"
+    )
+    parser.add_argument(
+        "--realtime",
+        action="store_true",
+        help="replay at wall-clock speed instead of on a virtual clock",
+    )
+    parser.add_argument(
+        "--early-answers",
+        action="store_true",
+        help="also replay with early answer capture and report the wall-time saved",
+    )
+    parser.add_argument("--verbose", action="store_true", help="show orchestrator logs")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    results = []
+    baseline_total = early_total = 0.0
+    for path in args.recordings:
+        events = load_events(path)
+        replayed = summarize(run_replay(events, realtime=args.realtime))
+        result = {
+            "recording": str(path),
+            "mode": "realtime" if args.realtime else "virtual",
+            "recorded": summarize(events),
+            "replayed": replayed,
+        }
+        if args.early_answers:
+            early = summarize(
+                run_replay(events, realtime=args.realtime, early_answer_capture=True)
+            )
+            result["early_answers"] = early
+            if replayed["total_seconds"] and early["total_seconds"]:
+                result["savings"] = _savings(replayed["total_seconds"], early["total_seconds"])
+                baseline_total += replayed["total_seconds"]
+                early_total += early["total_seconds"]
+        results.append(result)
+
+    output: dict[str, Any] = {"sessions": results}
+    if args.early_answers:
+        output["total_savings"] = _savings(baseline_total, early_total)
+    print(json.dumps(output, indent=2))
+
+
+if __name__ == "__main__":
+    main()
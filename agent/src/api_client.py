@@ -2,6 +2,10 @@ import httpx
 import logging
 from typing import Dict, Optional, Any
 
+from pydantic import ValidationError
+
+from src.models import Interview, decode_interview
+
 logger = logging.getLogger(__name__)
 
 class NestJSClient:
@@ -17,16 +21,19 @@ class NestJSClient:
             return json_response['data']
         return json_response
     
-    async def get_interview_details(self, interview_id: str, room_name: str) -> Optional[Dict[str, Any]]:
-        """Fetch interview details with questions for agent"""
+    async def get_interview_details(self, interview_id: str, room_name: str) -> Optional[Interview]:
+        """Fetch interview details with questions for agent (validated on decode)"""
         try:
             url = f"{self.base_url}/interviews/agent/{interview_id}?room_name={room_name}"
             logger.info(f"Fetching interview details from: {url}")
             response = await self.client.get(url)
             response.raise_for_status()
-            data = self._unwrap_response(response.json())
-            logger.info(f"Got interview data: job_role={data.get('job_role')}, questions={len(data.get('questions', []))}")
+            data = decode_interview(response.content)
+            logger.info(f"Got interview data: job_role={data.job_role}, questions={len(data.questions)}")
             return data
+        except ValidationError as e:
+            logger.error(f"Malformed interview data ({e.error_count()} errors): {e}")
+            return None
         except httpx.RequestError as e:
             logger.error(f"Network error getting interview details: {e}")
             return None
@@ -5,6 +5,10 @@ from dotenv import load_dotenv
 # Load .env file from project root (will not override existing env vars)
 load_dotenv()
 
+# Time kept back from WORKER_DRAIN_TIMEOUT to end an unfinished interview
+# (partial answer, closing message, backend flush and session close)
+DRAIN_END_MARGIN_SECONDS = 60
+
 
 class Config:
     """Application configuration loaded from environment variables."""
@@ -52,6 +56,58 @@ class Config:
         
         # Logging
         self.log_level: str = os.getenv("LOG_LEVEL", "INFO")
+        
+        # Event loop monitoring (seconds)
+        self.loop_monitor_interval: float = self._get_float("LOOP_MONITOR_INTERVAL", 0.5)
+        self.loop_stall_threshold: float = self._get_float("LOOP_STALL_THRESHOLD", 0.25)
+        self.loop_stats_log_interval: float = self._get_float("LOOP_STATS_LOG_INTERVAL", 30.0)
+        
+        # Session recording for offline replay (disabled when unset)
+        self.session_recording_dir: str | None = os.getenv("SESSION_RECORDING_DIR")
+        
+        # Buffer speech heard during agent playout and allow interrupting questions
+        self.early_answer_capture: bool = self._get_bool("EARLY_ANSWER_CAPTURE", False)
+        
+        # Graceful drain on SIGTERM: how long running interviews may take to finish
+        # before the worker shuts them down (seconds, LiveKit's default is 1800).
+        # 0 = no timeout. Otherwise it must be longer than DRAIN_END_MARGIN_SECONDS,
+        # the time kept back to end an unfinished interview.
+        self.worker_drain_timeout: int = self._get_int("WORKER_DRAIN_TIMEOUT", 1800)
+        if self.worker_drain_timeout < 0 or 0 < self.worker_drain_timeout <= DRAIN_END_MARGIN_SECONDS:
+            logging.warning(
+                f"Invalid WORKER_DRAIN_TIMEOUT value '{self.worker_drain_timeout}': must be 0 "
+                f"(no timeout) or more than {DRAIN_END_MARGIN_SECONDS}s. Using default 1800"
+            )
+            self.worker_drain_timeout = 1800
+        
+        # Per-session soft resource limits (0 or empty = no limit)
+        self.session_max_transcript_bytes: int | None = self._get_limit(
+            "SESSION_MAX_TRANSCRIPT_BYTES", 1024 * 1024
+        )
+        self.session_max_data_bytes: int | None = self._get_limit(
+            "SESSION_MAX_DATA_BYTES", 16 * 1024 * 1024
+        )
+        self.session_max_tasks: int | None = self._get_limit("SESSION_MAX_TASKS", 100)
+        # Traced allocation growth limit, only checked when SESSION_TRACEMALLOC is on
+        self.session_max_allocated_mb: float | None = self._get_limit(
+            "SESSION_MAX_ALLOCATED_MB", None, cast=float
+        )
+        self.session_tracemalloc: bool = self._get_bool("SESSION_TRACEMALLOC", False)
+        # What to do when a session goes over a limit: "warn" or "end" (end the session)
+        self.session_limit_action: str = os.getenv("SESSION_LIMIT_ACTION", "warn").lower()
+        if self.session_limit_action not in ("warn", "end"):
+            logging.warning(
+                f"Invalid SESSION_LIMIT_ACTION value '{self.session_limit_action}'. "
+                f"Using default 'warn'"
+            )
+            self.session_limit_action = "warn"
+        
+        # Worker-level job memory limits enforced by LiveKit (MB, 0 = no hard limit)
+        self.job_memory_warn_mb: float = self._get_float("JOB_MEMORY_WARN_MB", 500.0)
+        self.job_memory_limit_mb: float = self._get_float("JOB_MEMORY_LIMIT_MB", 0.0)
+        
+        # How often the worker re-checks the backend before taking interviews (seconds)
+        self.backend_check_interval: float = self._get_float("BACKEND_CHECK_INTERVAL", 30.0)
     
     @staticmethod
     def _get_required(key: str) -> str:
@@ -61,6 +117,52 @@ class Config:
             raise ValueError(f"Missing required environment variable: {key}")
         return value
     
+    @staticmethod
+    def _get_float(key: str, default: float) -> float:
+        """Get an optional float environment variable, falling back to the default."""
+        raw = os.getenv(key)
+        if raw is None:
+            return default
+        try:
+            return float(raw)
+        except ValueError as e:
+            logging.warning(f"Invalid {key} value '{raw}': {e}. Using default {default}")
+            return default
+    
+    @staticmethod
+    def _get_int(key: str, default: int | None) -> int | None:
+        """Get an optional integer environment variable, falling back to the default."""
+        raw = os.getenv(key)
+        if raw is None or raw == "":
+            return default
+        try:
+            return int(raw)
+        except ValueError as e:
+            logging.warning(f"Invalid {key} value '{raw}': {e}. Using default {default}")
+            return default
+    
+    @staticmethod
+    def _get_limit(key: str, default: int | None, cast: type = int) -> int | float | None:
+        """Get an optional limit environment variable; 0 or an empty value means no limit."""
+        raw = os.getenv(key)
+        if raw is None:
+            return default
+        if raw.strip() == "":
+            return None
+        try:
+            return cast(raw) or None
+        except ValueError as e:
+            logging.warning(f"Invalid {key} value '{raw}': {e}. Using default {default}")
+            return default
+    
+    @staticmethod
+    def _get_bool(key: str, default: bool) -> bool:
+        """Get an optional boolean environment variable (true/false, 1/0, yes/no)."""
+        raw = os.getenv(key)
+        if raw is None:
+            return default
+        return raw.strip().lower() in ("1", "true", "yes", "on")
+    
     def has_google_cloud_credentials(self) -> bool:
         """Check if Google Cloud credentials are available."""
         # Check if credentials file is set
@@ -0,0 +1,233 @@
+"""
+Startup Diagnostics - Measures startup cost and gates job dispatch on readiness.
+
+This module provides:
+- run_startup_profile(): per-module import time, config load, VAD load,
+  STT/TTS provider construction and HTTP round-trip to the backend
+  (used by diagnose.py)
+- WorkerReadiness: the worker's load function. LiveKit dispatches jobs
+  over the worker's registration, so the worker reports full load until
+  its own startup (including prewarm) has finished and the backend is
+  reachable
+
+Heavy modules are imported inside the checks so that import time is
+measured rather than paid when this module is loaded.
+"""
+
+import asyncio
+import importlib
+import json
+import logging
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Modules imported by the agent, in the order it imports them
+IMPORT_MODULES = (
+    "httpx",
+    "livekit.agents",
+    "livekit.plugins.silero",
+    "livekit.plugins.noise_cancellation",
+    "livekit.plugins.deepgram",
+    "livekit.plugins.google",
+    "src.api_client",
+    "src.interview_orchestrator",
+)
+
+# Provider plugins are alternatives - only one of them has to import
+OPTIONAL_MODULES = {"livekit.plugins.deepgram", "livekit.plugins.google"}
+
+BACKEND_TIMEOUT_SECONDS = 5.0
+
+
+def _timed(fn: Callable[[], Any]) -> dict[str, Any]:
+    """Run a check and report its duration and outcome."""
+    start = time.perf_counter()
+    try:
+        fn()
+        return {"ok": True, "ms": round((time.perf_counter() - start) * 1000, 1)}
+    except Exception as e:
+        return {
+            "ok": False,
+            "ms": round((time.perf_counter() - start) * 1000, 1),
+            "error": f"{type(e).__name__}: {e}",
+        }
+
+
+def profile_imports(modules: tuple[str, ...] = IMPORT_MODULES) -> dict[str, dict[str, Any]]:
+    """Import each module in turn and time it (modules already imported report ~0ms)."""
+    return {module: _timed(lambda m=module: importlib.import_module(m)) for module in modules}
+
+
+def _load_config():
+    importlib.import_module("src.config")
+
+
+def _load_vad():
+    from src.providers import load_vad
+    load_vad()
+
+
+def _construct_providers():
+    from src.providers import create_speech_providers
+    create_speech_providers()
+
+
+async def check_backend(url: str, timeout: float = BACKEND_TIMEOUT_SECONDS) -> dict[str, Any]:
+    """Measure an HTTP round-trip to the backend. Any non-5xx response counts as reachable."""
+    import httpx
+
+    start = time.perf_counter()
+    try:
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            response = await client.get(url)
+        result = {
+            "ok": response.status_code < 500,
+            "status": response.status_code,
+        }
+    except httpx.HTTPError as e:
+        result = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+    result["ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+
+async def run_startup_profile(
+    backend_url: Optional[str] = None,
+    modules: tuple[str, ...] = IMPORT_MODULES,
+    modules_after_checks: tuple[str, ...] = (),
+) -> dict[str, Any]:
+    """Measure every startup step and report whether the worker can serve interviews.
+
+    `modules_after_checks` are imported after the config, VAD and provider
+    checks - for modules that would otherwise load the config themselves
+    (e.g. the agent module) and hide its cost.
+    """
+    start = time.perf_counter()
+    imports = await asyncio.to_thread(profile_imports, modules)
+
+    checks: dict[str, dict[str, Any]] = {}
+    checks["config"] = await asyncio.to_thread(_timed, _load_config)
+    if checks["config"]["ok"]:
+        checks["vad"] = await asyncio.to_thread(_timed, _load_vad)
+        checks["providers"] = await asyncio.to_thread(_timed, _construct_providers)
+        if backend_url is None:
+            from src.config import config
+            backend_url = config.nestjs_api_url
+    else:
+        checks["vad"] = checks["providers"] = {"ok": False, "error": "skipped: config failed"}
+    imports.update(await asyncio.to_thread(profile_imports, modules_after_checks))
+
+    if backend_url:
+        checks["backend"] = await check_backend(backend_url)
+        checks["backend"]["url"] = backend_url
+    else:
+        checks["backend"] = {"ok": False, "error": "no backend URL configured"}
+
+    required_imports_ok = all(
+        result["ok"] for module, result in imports.items() if module not in OPTIONAL_MODULES
+    )
+    return {
+        "ok": required_imports_ok and all(check["ok"] for check in checks.values()),
+        "total_ms": round((time.perf_counter() - start) * 1000, 1),
+        "imports": imports,
+        "checks": checks,
+    }
+
+
+async def _write_json(writer: asyncio.StreamWriter, status: int, body: dict[str, Any]):
+    payload = json.dumps(body).encode("utf-8")
+    reason = {200: "OK", 404: "Not Found", 503: "Service Unavailable"}.get(status, "")
+    writer.write(
+        f"HTTP/1.1 {status} {reason}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(payload)}\r\n"
+        f"Connection: close\r\n\r\n".encode("ascii") + payload
+    )
+    await writer.drain()
+    writer.close()
+
+
+async def _read_path(reader: asyncio.StreamReader) -> str:
+    """Read an HTTP request and return its path (headers are ignored)."""
+    request_line = (await reader.readline()).decode("latin-1").split()
+    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+        pass
+    return request_line[1].split("?", 1)[0] if len(request_line) > 1 else "/"
+
+
+async def start_stand_in_backend(host: str = "127.0.0.1") -> tuple[asyncio.AbstractServer, str]:
+    """Start a local HTTP stand-in for the NestJS backend and return (server, url)."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        await _read_path(reader)
+        await _write_json(writer, 200, {"success": True, "data": {}})
+
+    server = await asyncio.start_server(handle, host, 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://{host}:{port}/"
+
+
+class WorkerReadiness:
+    """Reports the worker as fully loaded until it can actually serve interviews.
+
+    Pass load() as the AgentServer load_fnc. Until the worker has started
+    (which includes prewarming its idle job processes), while the backend
+    is unreachable and once draining, the worker reports a load of 1.0, so
+    LiveKit marks it full in production mode and dispatches no interviews
+    to it. Otherwise the default CPU-based load is reported.
+    """
+
+    def __init__(
+        self,
+        backend_url: str,
+        check_interval: float = 30.0,
+        default_load: Optional[Callable[[Any], float]] = None,
+    ):
+        self.backend_url = backend_url
+        self.check_interval = check_interval
+        self._default_load = default_load
+
+        self.started = False
+        self.backend_ok = False
+        self.draining = False
+        self.backend: dict[str, Any] = {}
+        self._created_at = time.perf_counter()
+        self._checker: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        """Started, the backend is reachable and not draining."""
+        return self.started and self.backend_ok and not self.draining
+
+    def load(self, server: Any) -> float:
+        """AgentServer load function (called from a worker thread)."""
+        if not self.ready:
+            return 1.0
+        return self._default_load(server) if self._default_load else 0.0
+
+    def mark_started(self):
+        """Record that the worker started and begin checking the backend.
+
+        Call on AgentServer's "worker_started" event, which in production
+        mode is emitted once the idle job processes have been prewarmed.
+        """
+        self.started = True
+        logger.info(f"Worker started in {(time.perf_counter() - self._created_at) * 1000:.0f}ms")
+        self._checker = asyncio.create_task(self._check_backend(), name="backend-readiness")
+
+    def mark_draining(self):
+        """Record that the worker started draining (called from the SIGTERM handler)."""
+        self.draining = True
+
+    async def _check_backend(self):
+        while True:
+            result = await check_backend(self.backend_url)
+            if result["ok"] != self.backend.get("ok"):
+                log = logger.info if result["ok"] else logger.warning
+                log(
+                    f"Backend {'reachable' if result['ok'] else 'unreachable'} ({result}), "
+                    f"worker ready: {self.started and result['ok']}"
+                )
+            self.backend, self.backend_ok = result, result["ok"]
+            await asyncio.sleep(self.check_interval)
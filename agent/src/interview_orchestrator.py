@@ -6,7 +6,11 @@ This orchestrator:
 - Handles user speech with debouncing (waits for user to finish speaking)
 - Submits answers to the backend for evaluation
 - Sends progress updates to the frontend via data channel
-- Prevents processing speech while agent is speaking
+- Prevents processing speech while agent is speaking, or optionally
+  buffers it as the start of the next answer (early answer capture)
+- Drains gracefully on worker shutdown: lets the interview run to
+  completion, and only if the drain deadline passes first submits the
+  partial answer and ends the interview early
 """
 
 import asyncio
@@ -17,6 +21,10 @@ from datetime import datetime
 from typing import Optional, Any
 
 from src.api_client import NestJSClient
+from src.loop_monitor import TaskRegistry
+from src.models import Interview, Question
+from src.resource_accounting import SessionResources
+from src.session_recorder import SessionRecorder
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +34,24 @@ MIN_TRANSCRIPT_LENGTH = 10
 # Time to wait after last speech before processing answer (debounce)
 SPEECH_DEBOUNCE_SECONDS = 4.0
 
+# How often drain progress is logged
+DRAIN_PROGRESS_INTERVAL_SECONDS = 30.0
+
+# Backend flush timeout after a drain that has no deadline
+DRAIN_FLUSH_TIMEOUT_SECONDS = 30.0
+
+# Spoken when the worker's drain deadline passes before the interview finished
+DRAIN_END_MESSAGE = (
+    "I'm sorry, but we have to end the interview here because of maintenance "
+    "on our side. Your answers so far have been saved. Thank you for your time."
+)
+
+# Spoken when the session is ended for going over its resource limits
+RESOURCE_LIMIT_END_MESSAGE = (
+    "I'm sorry, but we have to end the interview here because of a technical "
+    "issue on our side. Your answers so far have been saved. Thank you for your time."
+)
+
 
 class InterviewOrchestrator:
     """Orchestrates the interview flow with pre-generated questions."""
@@ -36,27 +62,44 @@ class InterviewOrchestrator:
         session: Any,  # AgentSession
         room_name: str,
         room: Any = None,  # LiveKit Room for data messages
+        tasks: Optional[TaskRegistry] = None,
+        recorder: Optional[SessionRecorder] = None,
+        early_answer_capture: bool = False,
+        resources: Optional[SessionResources] = None,
     ):
         self.nestjs_client = nestjs_client
         self.session = session
         self.room_name = room_name
         self.room = room
+        self.tasks = tasks or TaskRegistry(room_name)
+        self.recorder = recorder or SessionRecorder(enabled=False)
+        self.resources = resources or SessionResources(self.tasks)
+        # Buffer speech during agent playout instead of discarding it, and let
+        # the candidate interrupt questions to start answering right away
+        self.early_answer_capture = early_answer_capture
         
         # Interview state
-        self.interview_data: Optional[dict[str, Any]] = None
+        self.interview_data: Optional[Interview] = None
         self.current_question_index = 0
-        self.questions: list[dict[str, Any]] = []
+        self.questions: list[Question] = []
         self.interview_id: Optional[str] = None
         self.answer_start_time: Optional[datetime] = None
         
         # Speech handling state
         self.current_transcript = ""
         self._accumulated_transcript = ""
-        self._background_tasks = set()
         self._processing_speech = False
         self._waiting_for_answer = False
         self._debounce_task: Optional[asyncio.Task] = None
         self._agent_speaking = False  # Track if agent is currently speaking
+        self._early_transcript = ""  # Speech heard before the answer window opened
+        self._capturing_early_speech = False  # From the question (or "Thank you.") onward
+        
+        # Drain state (graceful shutdown)
+        self._ended = False  # Ended early - no further questions are asked
+        self._finished = asyncio.Event()  # Set once the interview has concluded or ended
+        self._drain_task: Optional[asyncio.Task] = None
+        self._backend_calls: set[asyncio.Task] = set()
     
     async def initialize(self) -> bool:
         """Fetch interview details from NestJS backend."""
@@ -70,30 +113,27 @@ class InterviewOrchestrator:
             self.interview_id = match.group(1)
             logger.info(f"Initializing interview {self.interview_id} for room {self.room_name}")
             
-            self.interview_data = await self.nestjs_client.get_interview_details(
-                self.interview_id, self.room_name
+            self.interview_data = await self.recorder.timed_call(
+                "get_interview_details",
+                self.nestjs_client.get_interview_details(self.interview_id, self.room_name),
             )
             
             if not self.interview_data:
                 logger.error("Failed to fetch interview data - got None")
                 return False
+            self.recorder.record("interview", data=self.interview_data.to_dict())
             
-            self.questions = self.interview_data.get("questions", [])
-            if not self.questions:
-                logger.error("No questions found in interview data")
-                return False
-            
-            # Sort questions by order
-            self.questions.sort(key=lambda x: x.get("order", 0))
+            # Questions are validated non-empty and sorted by order at decode time
+            self.questions = self.interview_data.questions
             
             # Resume from last completed question if any
-            completed_count = self.interview_data.get("completed_questions", 0)
+            completed_count = self.interview_data.completed_questions
             if completed_count > 0 and completed_count < len(self.questions):
                 self.current_question_index = completed_count
             
             logger.info(
-                f"Interview initialized: {self.interview_data.get('job_role')} "
-                f"({self.interview_data.get('difficulty')}) "
+                f"Interview initialized: {self.interview_data.job_role} "
+                f"({self.interview_data.difficulty}) "
                 f"with {len(self.questions)} questions"
             )
             return True
@@ -110,6 +150,7 @@ class InterviewOrchestrator:
         
         try:
             message = json.dumps(data).encode('utf-8')
+            self.resources.add_data_message(len(message))
             await self.room.local_participant.publish_data(message)
             logger.debug(f"Sent data message: {data.get('type')}")
         except Exception as e:
@@ -130,8 +171,8 @@ class InterviewOrchestrator:
             logger.error("Cannot start interview: Not initialized")
             return
         
-        job_role = self.interview_data.get("job_role", "the position")
-        difficulty = self.interview_data.get("difficulty", "standard")
+        job_role = self.interview_data.job_role
+        difficulty = self.interview_data.difficulty
         question_count = len(self.questions)
         
         # Greeting - use say() for exact text, not LLM-generated
@@ -145,13 +186,8 @@ class InterviewOrchestrator:
         
         logger.info("Starting interview with greeting...")
         
-        # Mark agent as speaking to ignore any user speech during this time
-        self._agent_speaking = True
-        try:
-            # Use say() to speak the exact greeting text
-            await session.say(greeting, allow_interruptions=False)
-        finally:
-            self._agent_speaking = False
+        # Use say() to speak the exact greeting text
+        await self._say(session, greeting)
         
         # Small pause before first question
         await asyncio.sleep(1.5)
@@ -161,13 +197,16 @@ class InterviewOrchestrator:
     
     async def ask_current_question(self, session: Any):
         """Ask the current question using exact text."""
+        if self._ended:
+            return
+        
         if self.current_question_index >= len(self.questions):
             await self.conclude_interview(session)
             return
         
         question = self.questions[self.current_question_index]
-        question_number = self.current_question_index + 1
-        question_content = question.get("content", "")
+        question_number = question.number
+        question_content = question.content
         
         # Reset state for new question - BEFORE speaking
         self.current_transcript = ""
@@ -181,7 +220,7 @@ class InterviewOrchestrator:
         await self.send_data_message({
             "type": "question",
             "question": {
-                "id": question.get("id"),
+                "id": question.id,
                 "content": question_content,
                 "order": question_number,
             }
@@ -190,23 +229,62 @@ class InterviewOrchestrator:
         # Send progress update
         await self.send_progress_update()
         
-        # Mark agent as speaking - ignore user speech during question
-        self._agent_speaking = True
-        try:
-            # Speak the question using say() for exact text
-            question_text = f"Question {question_number}: {question_content}"
-            await session.say(question_text, allow_interruptions=False)
-        finally:
-            self._agent_speaking = False
+        # Speak the question using say() for exact text
+        self.recorder.record("question", index=self.current_question_index)
+        self._capturing_early_speech = self.early_answer_capture
+        await self._say(session, question.spoken_text, interruptible=self.early_answer_capture)
         
-        # NOW start waiting for answer (after question is fully spoken)
+        # NOW start waiting for answer (after question is fully spoken or interrupted)
         self.answer_start_time = datetime.now()
         self._waiting_for_answer = True
+        self._capturing_early_speech = False
+        self.recorder.record("answer_window", index=self.current_question_index)
         
         logger.info(f"Question {question_number} asked, now waiting for answer...")
+        
+        # Speech captured during playback becomes the start of the answer
+        if self._early_transcript:
+            early_transcript, self._early_transcript = self._early_transcript, ""
+            logger.info(f"Using {len(early_transcript)} chars of speech captured during playback")
+            await self._accept_speech(early_transcript)
+    
+    async def _say(self, session: Any, text: str, interruptible: bool = False):
+        """Speak exact text, ignoring user speech while the agent is talking."""
+        self._agent_speaking = True
+        start = self.recorder.clock()
+        interrupted = None
+        try:
+            handle = await session.say(text, allow_interruptions=interruptible)
+            interrupted = bool(getattr(handle, "interrupted", False))
+        finally:
+            self._agent_speaking = False
+            # The replay only reuses durations of utterances that played out in full
+            self.recorder.record(
+                "say",
+                t=start,
+                text=text,
+                duration=round(self.recorder.clock() - start, 3),
+                interruptible=interruptible,
+                interrupted=interrupted,
+            )
     
     async def on_user_speech_committed(self, transcript: str):
         """Handle transcribed user speech with debouncing."""
+        self.recorder.record("transcript", index=self.current_question_index, text=transcript)
+        self.resources.add_transcript(transcript)
+        
+        # Keep speech heard during a question (or while the previous answer is
+        # being wrapped up) for the next answer - never speech from the greeting
+        if (
+            self._capturing_early_speech
+            and not self._waiting_for_answer
+            and transcript
+            and self.current_question_index < len(self.questions)
+        ):
+            self._early_transcript = f"{self._early_transcript} {transcript}".strip()
+            logger.debug(f"Buffered early speech: {len(self._early_transcript)} chars")
+            return
+        
         # Ignore speech while agent is speaking (prevents weird comments)
         if self._agent_speaking:
             logger.debug("Ignoring speech - agent is speaking")
@@ -220,6 +298,10 @@ class InterviewOrchestrator:
             logger.debug("Ignoring speech - already processing")
             return
         
+        await self._accept_speech(transcript)
+    
+    async def _accept_speech(self, transcript: str):
+        """Add speech to the current answer and restart the debounce timer."""
         # Accumulate transcript
         if transcript:
             if self._accumulated_transcript:
@@ -238,12 +320,19 @@ class InterviewOrchestrator:
         })
         
         # Cancel existing debounce timer - user is still speaking
-        if self._debounce_task and not self._debounce_task.done():
+        # (never the running task, which asks the next question and may flush early speech)
+        if (
+            self._debounce_task
+            and not self._debounce_task.done()
+            and self._debounce_task is not asyncio.current_task()
+        ):
             self._debounce_task.cancel()
             logger.debug("Reset debounce timer - user still speaking")
         
         # Start new debounce timer
-        self._debounce_task = asyncio.create_task(self._process_answer_after_silence())
+        self._debounce_task = self.tasks.create_task(
+            self._process_answer_after_silence(), name="answer-debounce"
+        )
     
     async def _process_answer_after_silence(self):
         """Wait for silence then process the answer."""
@@ -273,24 +362,25 @@ class InterviewOrchestrator:
             if self.answer_start_time:
                 duration = (datetime.now() - self.answer_start_time).total_seconds()
             
-            question = self.questions[self.current_question_index]
-            question_id = question.get("id")
+            question_id = self.questions[self.current_question_index].id
             
             logger.info(f"Processing answer for question {self.current_question_index + 1}")
             
             # Lock processing
             self._processing_speech = True
             self._waiting_for_answer = False
+            self._capturing_early_speech = self.early_answer_capture
             
             # Submit answer to backend for evaluation
+            self.recorder.record(
+                "answer",
+                index=self.current_question_index,
+                chars=len(self._accumulated_transcript),
+            )
             await self.submit_answer(question_id, self._accumulated_transcript, duration)
             
             # Brief acknowledgment - natural transition
-            self._agent_speaking = True
-            try:
-                await self.session.say("Thank you.", allow_interruptions=False)
-            finally:
-                self._agent_speaking = False
+            await self._say(self.session, "Thank you.", interruptible=self.early_answer_capture)
             
             # Brief pause before next question
             await asyncio.sleep(0.5)
@@ -320,10 +410,13 @@ class InterviewOrchestrator:
         logger.info(f"Submitting answer: {len(transcript)} chars, {duration:.1f}s")
         
         try:
-            result = await self.nestjs_client.submit_answer(
-                question_id=question_id,
-                transcript=transcript,
-                duration=duration,
+            result = await self._call_backend(
+                "submit_answer",
+                self.nestjs_client.submit_answer(
+                    question_id=question_id,
+                    transcript=transcript,
+                    duration=duration,
+                ),
             )
             if result:
                 score = result.get('score', 'N/A')
@@ -337,6 +430,8 @@ class InterviewOrchestrator:
         
         # Stop accepting speech
         self._waiting_for_answer = False
+        self._capturing_early_speech = False
+        self._early_transcript = ""
         
         closing = (
             f"Thank you for completing the interview! "
@@ -346,13 +441,8 @@ class InterviewOrchestrator:
             f"Thank you for your time and have a great day!"
         )
         
-        # Mark agent as speaking
-        self._agent_speaking = True
-        try:
-            # Speak closing using say()
-            await session.say(closing, allow_interruptions=False)
-        finally:
-            self._agent_speaking = False
+        # Speak closing using say()
+        await self._say(session, closing)
         
         # Send final progress update
         await self.send_data_message({
@@ -374,8 +464,140 @@ class InterviewOrchestrator:
         # Notify backend that interview is complete - this triggers evaluation!
         if self.interview_id:
             logger.info("Notifying backend to complete interview and run evaluation...")
-            await self.nestjs_client.complete_interview(self.interview_id, self.room_name)
+            await self._call_backend(
+                "complete_interview",
+                self.nestjs_client.complete_interview(self.interview_id, self.room_name),
+            )
             logger.info("Interview completion notified to backend - evaluation triggered")
+        
+        self.recorder.record("complete")
+        self._finished.set()
+    
+    async def _call_backend(self, call: str, awaitable: Any) -> Any:
+        """Run a backend call as a tracked task so teardown can flush it."""
+        task = self.tasks.create_task(
+            self.recorder.timed_call(call, awaitable), name=f"backend:{call}"
+        )
+        self._backend_calls.add(task)
+        task.add_done_callback(self._backend_calls.discard)
+        # Shielded: cancelling the caller (e.g. at disconnect) must not drop the call
+        return await asyncio.shield(task)
+    
+    async def flush_backend_calls(self, timeout: float):
+        """Wait for in-flight submit_answer/complete_interview calls to finish."""
+        pending = [task for task in self._backend_calls if not task.done()]
+        if not pending:
+            return
+        logger.info(f"Flushing {len(pending)} pending backend call(s)...")
+        _, still_pending = await asyncio.wait(pending, timeout=timeout)
+        if still_pending:
+            names = [task.get_name() for task in still_pending]
+            logger.error(f"Backend calls still pending after {timeout:.0f}s: {names}")
+    
+    async def drain(self, deadline: Optional[float]):
+        """Let the interview run to completion, ending it early only at the deadline.
+        
+        With no deadline (the worker has no drain timeout) the interview is
+        never ended early. Safe to call more than once - later calls wait for
+        the same drain.
+        """
+        if self._drain_task is None:
+            self._drain_task = self.tasks.create_task(self._drain(deadline), name="drain")
+        await asyncio.shield(self._drain_task)
+    
+    async def _drain(self, deadline: Optional[float]):
+        loop = asyncio.get_running_loop()
+        end = loop.time() + deadline if deadline is not None else None
+        limit = f"deadline {deadline:.0f}s" if deadline is not None else "no deadline"
+        logger.info(f"Draining interview {self.interview_id} ({limit})")
+        
+        reporter = self.tasks.create_task(self._report_drain_progress(end), name="drain-progress")
+        try:
+            try:
+                await asyncio.wait_for(self._finished.wait(), timeout=deadline)
+            except asyncio.TimeoutError:
+                logger.warning("Drain deadline reached before the interview finished")
+                await self.end_early("worker drain deadline reached", DRAIN_END_MESSAGE)
+            flush_timeout = (
+                max(1.0, end - loop.time()) if end is not None else DRAIN_FLUSH_TIMEOUT_SECONDS
+            )
+            await self.flush_backend_calls(timeout=flush_timeout)
+        finally:
+            reporter.cancel()
+        logger.info(f"Drain complete for interview {self.interview_id}")
+    
+    async def _report_drain_progress(self, end: Optional[float]):
+        loop = asyncio.get_running_loop()
+        while True:
+            if self._agent_speaking:
+                state = "agent speaking"
+            elif self._processing_speech:
+                state = "submitting answer"
+            elif self._waiting_for_answer:
+                state = f"waiting for answer ({len(self._accumulated_transcript)} chars so far)"
+            else:
+                state = "between questions"
+            pending = sum(1 for task in self._backend_calls if not task.done())
+            remaining = f", {max(0.0, end - loop.time()):.0f}s left" if end is not None else ""
+            logger.info(
+                f"Draining {self.room_name}: question {self.current_question_index + 1}/"
+                f"{len(self.questions)}, {state}, {pending} backend call(s) pending{remaining}"
+            )
+            await asyncio.sleep(DRAIN_PROGRESS_INTERVAL_SECONDS)
+    
+    async def _submit_partial_answer(self):
+        """Keep whatever the candidate has said so far for the current question."""
+        if (
+            not self._waiting_for_answer
+            or self._processing_speech
+            or len(self._accumulated_transcript) < MIN_TRANSCRIPT_LENGTH
+        ):
+            return
+        
+        if self._debounce_task and not self._debounce_task.done():
+            self._debounce_task.cancel()
+        self._processing_speech = True
+        self._waiting_for_answer = False
+        
+        duration = 0.0
+        if self.answer_start_time:
+            duration = (datetime.now() - self.answer_start_time).total_seconds()
+        question = self.questions[self.current_question_index]
+        logger.info(f"Submitting partial answer for question {self.current_question_index + 1}")
+        self.recorder.record(
+            "answer",
+            index=self.current_question_index,
+            chars=len(self._accumulated_transcript),
+        )
+        await self.submit_answer(question.id, self._accumulated_transcript, duration)
+    
+    async def end_early(self, reason: str, message: str):
+        """End the interview before all questions are answered.
+        
+        The answer in progress is submitted, no further questions are asked
+        and the candidate is told why the interview ended.
+        """
+        if self._ended or self._finished.is_set():
+            return
+        if self.current_question_index >= len(self.questions):
+            # All questions answered - let the closing remarks finish instead
+            await self._finished.wait()
+            return
+        logger.warning(
+            f"Ending interview {self.interview_id} early at question "
+            f"{self.current_question_index + 1}/{len(self.questions)}: {reason}"
+        )
+        self._ended = True
+        self.recorder.record("ended_early", index=self.current_question_index, reason=reason)
+        
+        await self._submit_partial_answer()
+        self._waiting_for_answer = False
+        self._capturing_early_speech = False
+        self._early_transcript = ""
+        
+        if self.session:
+            await self._say(self.session, message)
+        self._finished.set()
     
     async def handle_error(self, error: Exception):
         """Handle errors gracefully during interview."""
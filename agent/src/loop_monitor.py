@@ -0,0 +1,207 @@
+"""
+Event Loop Monitor - Detects event-loop stalls and tracks background tasks.
+
+This module provides:
+- TaskRegistry: spawns and tracks the background tasks of a single room
+  so live tasks can be counted and leaked tasks reported at teardown
+- LoopMonitor: samples event-loop lag and runs a watchdog thread that
+  captures the loop thread's stack when a callback blocks the loop for
+  longer than the stall threshold
+
+Audio glitches usually line up with loop stalls, so lag statistics are
+logged periodically and included in the per-session summary.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Coroutine, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TaskRegistry:
+    """Tracks background tasks spawned on behalf of a single room."""
+
+    def __init__(self, room_name: str):
+        self.room_name = room_name
+        self.spawned_count = 0
+        self._tasks: set[asyncio.Task] = set()
+
+    def create_task(self, coro: Coroutine[Any, Any, Any], name: Optional[str] = None) -> asyncio.Task:
+        """Spawn a task and keep a strong reference to it until it finishes."""
+        task = asyncio.create_task(coro, name=name)
+        self._tasks.add(task)
+        self.spawned_count += 1
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    @property
+    def live_count(self) -> int:
+        """Number of tasks that have not finished yet."""
+        return sum(1 for task in self._tasks if not task.done())
+
+    def live_tasks(self) -> list[asyncio.Task]:
+        """Tasks that have not finished yet."""
+        return [task for task in self._tasks if not task.done()]
+
+    async def shutdown(self, timeout: float = 1.0) -> list[str]:
+        """Cancel tasks still running at teardown and report them as leaked."""
+        leaked = self.live_tasks()
+        if not leaked:
+            return []
+
+        names = [task.get_name() for task in leaked]
+        logger.warning(
+            f"Room {self.room_name}: {len(leaked)} task(s) still running at teardown: {names}"
+        )
+        for task in leaked:
+            task.cancel()
+        await asyncio.wait(leaked, timeout=timeout)
+        return names
+
+
+class LoopMonitor:
+    """Samples event-loop lag and reports callbacks that block the loop."""
+
+    def __init__(
+        self,
+        sample_interval: float = 0.5,
+        stall_threshold: float = 0.25,
+        log_interval: float = 30.0,
+    ):
+        self.sample_interval = sample_interval
+        self.stall_threshold = stall_threshold
+        self.log_interval = log_interval
+
+        # Lag statistics (seconds)
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._lag_total = 0.0
+        self._sample_count = 0
+
+        # Stall statistics (written by the watchdog thread, or by the sampler
+        # for stalls too short for the watchdog to catch)
+        self.stall_count = 0
+        self.last_stall_stack: Optional[str] = None
+        self._stall_lock = threading.Lock()
+
+        self._registries: dict[str, TaskRegistry] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat = time.monotonic()
+        self._sampler_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def register(self, registry: TaskRegistry):
+        """Include a room's tasks in the per-room task counts."""
+        self._registries[registry.room_name] = registry
+
+    def unregister(self, registry: TaskRegistry):
+        """Stop counting a room's tasks."""
+        self._registries.pop(registry.room_name, None)
+
+    def start(self):
+        """Start lag sampling and the stall watchdog. Must be called from the loop."""
+        if self._sampler_task:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop_event.clear()
+
+        self._sampler_task = self._loop.create_task(self._sample_lag(), name="loop-monitor")
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+        logger.debug(
+            f"Loop monitor started (interval={self.sample_interval}s, "
+            f"stall threshold={self.stall_threshold}s)"
+        )
+
+    async def stop(self):
+        """Stop sampling and the watchdog thread."""
+        self._stop_event.set()
+        if self._sampler_task:
+            self._sampler_task.cancel()
+            try:
+                await self._sampler_task
+            except asyncio.CancelledError:
+                pass
+            self._sampler_task = None
+        if self._watchdog:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current lag, stall and task statistics."""
+        total_tasks = len(asyncio.all_tasks(self._loop)) if self._loop else 0
+        avg_lag = self._lag_total / self._sample_count if self._sample_count else 0.0
+        return {
+            "lag_ms_last": round(self.last_lag * 1000, 1),
+            "lag_ms_avg": round(avg_lag * 1000, 1),
+            "lag_ms_max": round(self.max_lag * 1000, 1),
+            "stalls": self.stall_count,
+            "tasks_total": total_tasks,
+            "tasks_per_room": {
+                name: registry.live_count for name, registry in self._registries.items()
+            },
+        }
+
+    async def _sample_lag(self):
+        """Measure how late the loop wakes us up from a fixed sleep."""
+        loop = asyncio.get_running_loop()
+        last_log = loop.time()
+
+        while True:
+            start = loop.time()
+            stalls_before = self.stall_count
+            await asyncio.sleep(self.sample_interval)
+            now = loop.time()
+
+            lag = max(0.0, now - start - self.sample_interval)
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            self._lag_total += lag
+            self._sample_count += 1
+
+            with self._stall_lock:
+                self._heartbeat = time.monotonic()
+                # The watchdog reports stalls with their stack - only count the ones it missed
+                missed_stall = lag >= self.stall_threshold and self.stall_count == stalls_before
+                if missed_stall:
+                    self.stall_count += 1
+            if missed_stall:
+                logger.warning(f"Event loop lag {lag * 1000:.0f}ms: {self.snapshot()}")
+
+            if now - last_log >= self.log_interval:
+                logger.info(f"Event loop stats: {self.snapshot()}")
+                last_log = now
+
+    def _watch(self):
+        """Watchdog thread - dump the loop thread's stack when it stops responding."""
+        reported_heartbeat = None
+
+        while not self._stop_event.wait(self.stall_threshold / 2):
+            with self._stall_lock:
+                heartbeat = self._heartbeat
+                blocked_for = time.monotonic() - heartbeat - self.sample_interval
+                if blocked_for < self.stall_threshold or heartbeat == reported_heartbeat:
+                    continue
+                # Report each stall once, with the stack of whatever is blocking the loop
+                reported_heartbeat = heartbeat
+                self.stall_count += 1
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else "<unavailable>\n"
+            self.last_stall_stack = stack
+            logger.warning(
+                f"Event loop blocked for {blocked_for * 1000:.0f}ms "
+                f"(threshold {self.stall_threshold * 1000:.0f}ms), loop thread stack:\n{stack}"
+            )
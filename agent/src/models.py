@@ -0,0 +1,102 @@
+"""
+Interview Models - Typed, compact interview data decoded from the backend.
+
+The agent endpoint response is decoded and validated in a single pass from
+the raw response bytes, so malformed data is rejected when the interview is
+fetched rather than failing mid-interview. The models are slotted
+dataclasses (no per-instance __dict__) and only keep the fields the agent
+uses. Per-question values needed on the hot path (question number and
+spoken text) are computed once at decode time.
+"""
+
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Annotated, Any, Optional, Union
+
+from pydantic import BeforeValidator, Discriminator, Field, Tag, TypeAdapter
+
+# Used in the greeting when the backend leaves these out
+DEFAULT_JOB_ROLE = "the position"
+DEFAULT_DIFFICULTY = "standard"
+
+NonEmptyStr = Annotated[str, Field(min_length=1)]
+
+
+def _or_default(default: str):
+    """Treat null or empty values like a missing key."""
+    return BeforeValidator(lambda value: value or default)
+
+
+@dataclass(slots=True)
+class Question:
+    """A pre-generated interview question."""
+
+    id: NonEmptyStr
+    content: NonEmptyStr
+    order: int = 0
+
+    # Computed by Interview once questions are sorted
+    number: int = field(default=0, init=False)
+    spoken_text: str = field(default="", init=False)
+
+
+@dataclass(slots=True)
+class Interview:
+    """Interview details for the agent, with questions sorted by order."""
+
+    questions: Annotated[list[Question], Field(min_length=1)]
+    job_role: Annotated[str, _or_default(DEFAULT_JOB_ROLE)] = DEFAULT_JOB_ROLE
+    difficulty: Annotated[str, _or_default(DEFAULT_DIFFICULTY)] = DEFAULT_DIFFICULTY
+    interview_id: Optional[str] = None
+    completed_questions: Annotated[int, Field(ge=0)] = 0
+    status: Optional[str] = None
+
+    def __post_init__(self):
+        self.questions.sort(key=attrgetter("order"))
+        for number, question in enumerate(self.questions, start=1):
+            question.number = number
+            question.spoken_text = f"Question {number}: {question.content}"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Backend-shaped dict (used for session recordings)."""
+        return {
+            "interview_id": self.interview_id,
+            "job_role": self.job_role,
+            "difficulty": self.difficulty,
+            "completed_questions": self.completed_questions,
+            "status": self.status,
+            "questions": [
+                {"id": q.id, "content": q.content, "order": q.order} for q in self.questions
+            ],
+        }
+
+
+@dataclass(slots=True)
+class _Envelope:
+    """The backend's { success: true, data: ... } response wrapper."""
+
+    data: Interview
+
+
+def _response_kind(value: Any) -> str:
+    return "envelope" if isinstance(value, dict) and "data" in value else "interview"
+
+
+_INTERVIEW_ADAPTER = TypeAdapter(
+    Annotated[
+        Union[Annotated[_Envelope, Tag("envelope")], Annotated[Interview, Tag("interview")]],
+        Discriminator(_response_kind),
+    ]
+)
+
+
+def decode_interview(raw: Union[bytes, str, dict[str, Any]]) -> Interview:
+    """Decode and validate interview data, wrapped or not.
+
+    Raises pydantic.ValidationError if the data is malformed.
+    """
+    if isinstance(raw, dict):
+        result = _INTERVIEW_ADAPTER.validate_python(raw)
+    else:
+        result = _INTERVIEW_ADAPTER.validate_json(raw)
+    return result.data if isinstance(result, _Envelope) else result
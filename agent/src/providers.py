@@ -0,0 +1,93 @@
+"""
+Speech Providers - Builds the STT, TTS and VAD used by the agent session.
+
+Shared by the agent entrypoint and the startup diagnostics so both measure
+and use exactly the same provider setup.
+"""
+
+import logging
+from typing import Any
+
+from livekit.plugins import silero
+
+from src.config import config
+
+# Try to import providers - we'll use what's available
+try:
+    from livekit.plugins import deepgram
+    DEEPGRAM_AVAILABLE = True
+except ImportError:
+    DEEPGRAM_AVAILABLE = False
+
+try:
+    from livekit.plugins import google
+    GOOGLE_AVAILABLE = True
+except ImportError:
+    GOOGLE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def create_speech_providers() -> tuple[Any, Any]:
+    """Create STT and TTS instances based on available credentials."""
+    # Priority: Deepgram (API key auth) > Google (service account auth)
+    if config.deepgram_api_key and DEEPGRAM_AVAILABLE:
+        logger.info("Using Deepgram STT and TTS")
+        stt_instance = deepgram.STT(
+            api_key=config.deepgram_api_key,
+            model="nova-2",
+            language="en",
+        )
+        tts_instance = deepgram.TTS(
+            api_key=config.deepgram_api_key,
+            model="aura-asteria-en",  # Female voice, natural sounding
+        )
+    elif config.google_credentials_file and GOOGLE_AVAILABLE:
+        logger.info(f"Using Google STT/TTS with credentials file: {config.google_credentials_file}")
+        stt_instance = google.STT(
+            credentials_file=config.google_credentials_file,
+            model=config.stt_model,
+            languages=[config.stt_language],
+            spoken_punctuation=True,
+        )
+        tts_instance = google.TTS(
+            credentials_file=config.google_credentials_file,
+            voice_name=config.tts_voice,
+            language=config.tts_language,
+        )
+    elif GOOGLE_AVAILABLE:
+        # Try Google with Application Default Credentials
+        logger.info("Attempting Google STT/TTS with Application Default Credentials")
+        try:
+            stt_instance = google.STT(
+                model=config.stt_model,
+                languages=[config.stt_language],
+                spoken_punctuation=True,
+            )
+            tts_instance = google.TTS(
+                voice_name=config.tts_voice,
+                language=config.tts_language,
+            )
+        except ValueError as e:
+            logger.error(f"Google STT/TTS initialization failed: {e}")
+            logger.error(
+                "Please set DEEPGRAM_API_KEY (recommended), "
+                "or set GOOGLE_APPLICATION_CREDENTIALS to a service account JSON file, "
+                "or run 'gcloud auth application-default login'."
+            )
+            raise
+    else:
+        raise RuntimeError(
+            "No STT/TTS provider available. Please set DEEPGRAM_API_KEY or configure Google Cloud credentials."
+        )
+
+    return stt_instance, tts_instance
+
+
+def load_vad() -> Any:
+    """Load Silero VAD tuned for interviews (longer silence before end of turn)."""
+    return silero.VAD.load(
+        min_speech_duration=0.5,
+        min_silence_duration=3.0,  # Wait 3 seconds before considering turn complete
+        prefix_padding_duration=0.5,
+    )
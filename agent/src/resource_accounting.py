@@ -0,0 +1,162 @@
+"""
+Session Resources - Per-session resource accounting with soft limits.
+
+Always-on counters track what a single interview costs the worker:
+transcript bytes received, data channel bytes sent and background tasks.
+Optionally (SESSION_TRACEMALLOC) allocations are traced with tracemalloc
+and measured against a baseline taken when the session started; this is
+attributable to the session when each job runs in its own process (the
+default process executor).
+
+Soft limits are checked periodically. Exceeding one logs a warning with
+the current usage (and the top allocation sites when tracing), and can
+optionally end the session: the callback gets which limits were exceeded.
+"""
+
+import asyncio
+import logging
+import tracemalloc
+from typing import Any, Callable, Optional
+
+from src.loop_monitor import TaskRegistry
+
+logger = logging.getLogger(__name__)
+
+# How often soft limits are checked
+CHECK_INTERVAL_SECONDS = 5.0
+
+# Number of allocation sites listed when a session goes over budget
+TOP_ALLOCATION_SITES = 5
+
+
+class SessionResources:
+    """Counts the resources used by one interview session and enforces soft limits."""
+
+    def __init__(
+        self,
+        tasks: TaskRegistry,
+        max_transcript_bytes: Optional[int] = None,
+        max_data_bytes: Optional[int] = None,
+        max_tasks: Optional[int] = None,
+        max_allocated_mb: Optional[float] = None,
+        track_allocations: bool = False,
+        end_session_on_limit: bool = False,
+        on_limit_exceeded: Optional[Callable[[str], None]] = None,
+    ):
+        self.tasks = tasks
+        self.max_transcript_bytes = max_transcript_bytes
+        self.max_data_bytes = max_data_bytes
+        self.max_tasks = max_tasks
+        self.max_allocated_mb = max_allocated_mb
+        self.track_allocations = track_allocations
+        self.end_session_on_limit = end_session_on_limit
+        self.on_limit_exceeded = on_limit_exceeded
+
+        # Always-on counters
+        self.transcript_bytes = 0
+        self.transcript_events = 0
+        self.data_bytes = 0
+        self.data_messages = 0
+
+        self._exceeded: set[str] = set()
+        self._baseline_traced = 0
+        self._baseline_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._monitor: Optional[asyncio.Task] = None
+
+    def add_transcript(self, text: str):
+        """Count a transcript event received from STT."""
+        self.transcript_bytes += len(text.encode("utf-8"))
+        self.transcript_events += 1
+
+    def add_data_message(self, size: int):
+        """Count a message published on the data channel."""
+        self.data_bytes += size
+        self.data_messages += 1
+
+    @property
+    def allocated_bytes(self) -> Optional[int]:
+        """Traced memory growth since the session started, if tracing is enabled."""
+        if not self.track_allocations or not tracemalloc.is_tracing():
+            return None
+        return tracemalloc.get_traced_memory()[0] - self._baseline_traced
+
+    def start(self):
+        """Take the allocation baseline and start checking limits."""
+        if self.track_allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            self._baseline_traced = tracemalloc.get_traced_memory()[0]
+            self._baseline_snapshot = tracemalloc.take_snapshot()
+        self._monitor = self.tasks.create_task(self._watch(), name="resource-monitor")
+
+    async def stop(self):
+        """Stop checking limits."""
+        if self._monitor:
+            self._monitor.cancel()
+            try:
+                await self._monitor
+            except asyncio.CancelledError:
+                pass
+            self._monitor = None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current usage counters."""
+        usage: dict[str, Any] = {
+            "transcript_bytes": self.transcript_bytes,
+            "transcript_events": self.transcript_events,
+            "data_bytes": self.data_bytes,
+            "data_messages": self.data_messages,
+            "tasks_live": self.tasks.live_count,
+            "tasks_spawned": self.tasks.spawned_count,
+        }
+        allocated = self.allocated_bytes
+        if allocated is not None:
+            usage["allocated_mb"] = round(allocated / (1024 * 1024), 2)
+        return usage
+
+    def top_allocations(self, limit: int = TOP_ALLOCATION_SITES) -> list[str]:
+        """Source lines with the largest allocation growth since the session started."""
+        if self._baseline_snapshot is None or not tracemalloc.is_tracing():
+            return []
+        stats = tracemalloc.take_snapshot().compare_to(self._baseline_snapshot, "lineno")
+        return [str(stat) for stat in stats[:limit]]
+
+    def check(self) -> list[str]:
+        """Return the limits exceeded since the last check (each is reported once)."""
+        allocated = self.allocated_bytes
+        max_allocated = (
+            int(self.max_allocated_mb * 1024 * 1024) if self.max_allocated_mb else None
+        )
+        usage = (
+            ("transcript_bytes", self.transcript_bytes, self.max_transcript_bytes),
+            ("data_bytes", self.data_bytes, self.max_data_bytes),
+            ("tasks", self.tasks.live_count, self.max_tasks),
+            ("allocated_bytes", allocated, max_allocated),
+        )
+
+        exceeded = []
+        for name, value, limit in usage:
+            if limit is None or value is None or name in self._exceeded:
+                continue
+            if value > limit:
+                self._exceeded.add(name)
+                exceeded.append(f"{name} {value} > {limit}")
+        return exceeded
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(CHECK_INTERVAL_SECONDS)
+            exceeded = self.check()
+            if not exceeded:
+                continue
+
+            reason = ", ".join(exceeded)
+            logger.warning(
+                f"Session {self.tasks.room_name} over budget ({reason}), usage: {self.snapshot()}"
+            )
+            for site in self.top_allocations():
+                logger.warning(f"  allocation growth: {site}")
+
+            if self.end_session_on_limit and self.on_limit_exceeded:
+                logger.warning(f"Ending session {self.tasks.room_name} cleanly: over budget")
+                self.on_limit_exceeded(reason)
@@ -0,0 +1,123 @@
+"""
+Session Recorder - Compact per-interview event log for offline replay.
+
+When SESSION_RECORDING_DIR is set, each interview writes one JSON Lines
+file containing, with timestamps relative to the session start:
+- the interview data fetched from the backend
+- user transcripts (with the question they arrived during)
+- user/agent state changes
+- say() calls with their playout duration
+- backend calls with their latency
+
+Events are buffered in memory and written once when the session closes,
+so recording adds no I/O to the conversation hot path.
+"""
+
+import json
+import logging
+import re
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SessionRecorder:
+    """Buffers timestamped session events and writes them as JSON Lines."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.path = path
+        self.enabled = enabled
+        self.clock = clock
+        self.events: list[dict[str, Any]] = []
+        self._start = clock()
+
+    @classmethod
+    def for_room(cls, directory: Optional[str], room_name: str) -> "SessionRecorder":
+        """Create a file-backed recorder, or a disabled one if no directory is configured."""
+        if not directory:
+            return cls(enabled=False)
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", room_name)
+        path = Path(directory) / f"{safe_name}-{int(time.time())}.jsonl"
+        return cls(path=path)
+
+    def elapsed(self) -> float:
+        """Seconds since the recorder was created."""
+        return self.clock() - self._start
+
+    def record(self, kind: str, t: Optional[float] = None, **fields: Any):
+        """Append an event. `t` is an absolute clock value, defaulting to now."""
+        if not self.enabled:
+            return
+        timestamp = (t if t is not None else self.clock()) - self._start
+        self.events.append({"t": round(timestamp, 3), "type": kind, **fields})
+
+    async def timed_call(self, call: str, awaitable: Awaitable[T]) -> T:
+        """Await a backend call and record its latency."""
+        if not self.enabled:
+            return await awaitable
+        start = self.clock()
+        ok = False
+        try:
+            result = await awaitable
+            ok = bool(result)
+            return result
+        finally:
+            self.record("backend", t=start, call=call, latency=round(self.clock() - start, 3), ok=ok)
+
+    def close(self):
+        """Write buffered events to disk."""
+        if not self.enabled or not self.path or not self.events:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("w", encoding="utf-8") as f:
+                for event in self.events:
+                    f.write(json.dumps(event, separators=(",", ":")) + "\n")
+            logger.info(f"Session recording written: {self.path} ({len(self.events)} events)")
+        except OSError as e:
+            logger.error(f"Failed to write session recording {self.path}: {e}")
+
+
+def load_events(path: Path) -> list[dict[str, Any]]:
+    """Load a recording written by SessionRecorder."""
+    with Path(path).open(encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def compute_turn_timings(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Derive per-question timings (seconds from session start) from an event log."""
+    turns: dict[int, dict[str, Any]] = {}
+
+    for event in events:
+        kind = event["type"]
+        index = event.get("index")
+        if kind == "question":
+            turns[index] = {"index": index, "asked": event["t"]}
+        elif index is None or index not in turns:
+            continue
+        elif kind == "answer_window":
+            turns[index].setdefault("answer_window", event["t"])
+        elif kind == "transcript":
+            turns[index].setdefault("first_speech", event["t"])
+            turns[index]["last_speech"] = event["t"]
+        elif kind == "answer":
+            turns[index]["submitted"] = event["t"]
+
+    ordered = [turns[i] for i in sorted(turns)]
+    end = next((e["t"] for e in reversed(events) if e["type"] == "complete"), None)
+    for turn, following in zip(ordered, ordered[1:] + [None]):
+        turn["ended"] = following["asked"] if following else end
+        if "submitted" in turn and "last_speech" in turn:
+            turn["response_delay"] = round(turn["submitted"] - turn["last_speech"], 3)
+        if turn["ended"] is not None:
+            turn["duration"] = round(turn["ended"] - turn["asked"], 3)
+    return ordered
@@ -0,0 +1,136 @@
+"""
+Worker Drain - Tells running interviews that the worker is shutting down.
+
+On SIGTERM the LiveKit worker only stops accepting jobs and waits (up to
+its drain timeout) for running ones to finish. Job processes ignore
+SIGTERM, and the signal only reaches the worker process (PID 1 under
+Docker/Kubernetes), so interviews never learn that a drain started.
+
+This module provides:
+- install_drain_forwarding(): wraps the worker process's SIGTERM handler
+  to forward the signal to the processes running jobs (and to notify jobs
+  running on threads of this process) before LiveKit starts its drain,
+  and to report drain progress from the worker
+- on_worker_drain(): called from a job's entrypoint to be notified
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import threading
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# How often the worker logs how many interviews are still running
+DRAIN_PROGRESS_INTERVAL_SECONDS = 30.0
+
+# Jobs running on threads of this process (thread executor), notified directly
+_thread_jobs: dict[int, tuple[asyncio.AbstractEventLoop, Callable[[], None]]] = {}
+_thread_jobs_lock = threading.Lock()
+
+
+def on_worker_drain(callback: Callable[[], None], in_process: bool = True) -> Callable[[], None]:
+    """Call `callback` on this job's event loop when the worker starts draining.
+
+    `in_process` is True when the job runs in its own process (the default
+    process executor). Returns a function that stops listening.
+    """
+    loop = asyncio.get_running_loop()
+    if in_process:
+        try:
+            # LiveKit sets SIGTERM to SIG_IGN in job processes; only the worker sends it
+            loop.add_signal_handler(signal.SIGTERM, callback)
+            return lambda: loop.remove_signal_handler(signal.SIGTERM)
+        except (NotImplementedError, RuntimeError, ValueError) as e:
+            logger.warning(f"Cannot listen for worker drain in this job process: {e}")
+            return lambda: None
+
+    key = id(callback)
+    with _thread_jobs_lock:
+        _thread_jobs[key] = (loop, callback)
+
+    def stop_listening():
+        with _thread_jobs_lock:
+            _thread_jobs.pop(key, None)
+
+    return stop_listening
+
+
+def _running_job_pids(server: Any) -> list[int]:
+    """PIDs of the processes currently running a job."""
+    # livekit-agents 1.3 has no public accessor for the job processes
+    pool = getattr(server, "_proc_pool", None)
+    if pool is None:
+        logger.warning("Cannot find the worker's job processes - interviews will not drain")
+        return []
+    return [
+        proc.pid
+        for proc in pool.processes
+        if proc.running_job and getattr(proc, "pid", None)
+    ]
+
+
+def _notify_jobs(server: Any):
+    pids = _running_job_pids(server)
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    with _thread_jobs_lock:
+        thread_jobs = list(_thread_jobs.values())
+    for loop, callback in thread_jobs:
+        loop.call_soon_threadsafe(callback)
+    logger.info(f"Worker draining: notified {len(pids) + len(thread_jobs)} running interview(s)")
+
+
+async def _report_progress(server: Any, timeout: Optional[float]):
+    start = time.monotonic()
+    while True:
+        await asyncio.sleep(DRAIN_PROGRESS_INTERVAL_SECONDS)
+        elapsed = time.monotonic() - start
+        remaining = f", {max(0.0, timeout - elapsed):.0f}s left" if timeout else ""
+        logger.info(
+            f"Worker draining: {len(server.active_jobs)} interview(s) still running "
+            f"after {elapsed:.0f}s{remaining}"
+        )
+
+
+def install_drain_forwarding(
+    server: Any,
+    timeout: Optional[float] = None,
+    on_drain: Optional[Callable[[], None]] = None,
+):
+    """Forward the worker's SIGTERM to running jobs before LiveKit's own handler runs.
+
+    Must be called on the worker's main thread after the LiveKit CLI has
+    installed its signal handlers (e.g. on the "worker_started" event).
+    A second SIGTERM goes straight to LiveKit (forced exit).
+    """
+    loop = asyncio.get_running_loop()
+    previous = signal.getsignal(signal.SIGTERM)
+    progress: list[asyncio.Task] = []
+
+    def handle_sigterm(signum: int, frame: Any):
+        signal.signal(signal.SIGTERM, previous)
+        logger.info("SIGTERM received - draining running interviews")
+        if on_drain:
+            on_drain()
+        _notify_jobs(server)
+        loop.call_soon_threadsafe(
+            lambda: progress.append(
+                loop.create_task(_report_progress(server, timeout), name="drain-progress")
+            )
+        )
+        if callable(previous):
+            previous(signum, frame)
+        elif previous == signal.SIG_DFL:
+            signal.raise_signal(signum)
+
+    try:
+        signal.signal(signal.SIGTERM, handle_sigterm)
+    except ValueError as e:
+        logger.warning(f"Cannot forward SIGTERM to running interviews: {e}")
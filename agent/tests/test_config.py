@@ -0,0 +1,19 @@
+import importlib
+
+import pytest
+
+REQUIRED_ENV = ("LIVEKIT_URL", "LIVEKIT_API_KEY", "LIVEKIT_API_SECRET", "GOOGLE_API_KEY", "NESTJS_API_URL")
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [("0", 0), ("61", 61), ("3600", 3600), ("60", 1800), ("30", 1800), ("-5", 1800)],
+)
+def test_drain_timeout_must_be_zero_or_longer_than_the_end_margin(monkeypatch, raw, expected):
+    for key in REQUIRED_ENV:
+        monkeypatch.setenv(key, "test")
+    monkeypatch.setenv("WORKER_DRAIN_TIMEOUT", raw)
+
+    config = importlib.import_module("src.config").Config()
+
+    assert config.worker_drain_timeout == expected
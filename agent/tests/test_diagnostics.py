@@ -0,0 +1,58 @@
+import asyncio
+
+from src import diagnostics
+from src.diagnostics import WorkerReadiness, start_stand_in_backend
+
+
+async def _wait_for_check(readiness: WorkerReadiness):
+    while not readiness.backend:
+        await asyncio.sleep(0.01)
+
+
+async def test_full_load_until_started():
+    readiness = WorkerReadiness("http://127.0.0.1:1/", default_load=lambda server: 0.2)
+    readiness.backend_ok = True
+
+    assert readiness.load(None) == 1.0
+
+
+async def test_default_load_once_started_and_backend_reachable():
+    server, url = await start_stand_in_backend()
+    async with server:
+        readiness = WorkerReadiness(url, default_load=lambda server: 0.2)
+        readiness.mark_started()
+        await _wait_for_check(readiness)
+
+        assert readiness.ready
+        assert readiness.load(None) == 0.2
+
+
+async def test_full_load_while_backend_unreachable():
+    server, url = await start_stand_in_backend()
+    server.close()
+    await server.wait_closed()
+
+    readiness = WorkerReadiness(url, default_load=lambda server: 0.2)
+    readiness.mark_started()
+    await _wait_for_check(readiness)
+
+    assert not readiness.ready
+    assert readiness.load(None) == 1.0
+    assert "error" in readiness.backend
+
+
+async def test_config_is_timed_before_modules_that_load_it(monkeypatch):
+    imported = []
+    monkeypatch.setattr(diagnostics.importlib, "import_module", imported.append)
+    monkeypatch.setattr(diagnostics, "_load_vad", lambda: None)
+    monkeypatch.setattr(diagnostics, "_construct_providers", lambda: None)
+
+    server, url = await start_stand_in_backend()
+    async with server:
+        report = await diagnostics.run_startup_profile(
+            url, modules=("httpx",), modules_after_checks=("agent",)
+        )
+
+    assert imported == ["httpx", "src.config", "agent"]
+    assert list(report["imports"]) == ["httpx", "agent"]
+    assert report["ok"]
@@ -0,0 +1,123 @@
+import asyncio
+import json
+
+from replay_session import FakeNestJSClient, FakeRoom, FakeSession, VirtualTimeEventLoop
+from src.interview_orchestrator import DRAIN_END_MESSAGE, InterviewOrchestrator
+from src.session_recorder import SessionRecorder
+
+INTERVIEW = {
+    "job_role": "Backend Engineer",
+    "difficulty": "medium",
+    "questions": [
+        {"id": "q1", "content": "What is a closure?", "order": 1},
+        {"id": "q2", "content": "How does a hash map handle collisions?", "order": 2},
+    ],
+}
+
+
+def _run(scenario):
+    loop = VirtualTimeEventLoop()
+    try:
+        return loop.run_until_complete(scenario())
+    finally:
+        loop.close()
+
+
+async def _start_interview():
+    events = [{"t": 0.0, "type": "interview", "data": INTERVIEW}]
+    room = FakeRoom("interview-abc-123")
+    orchestrator = InterviewOrchestrator(
+        nestjs_client=FakeNestJSClient(events),
+        session=FakeSession(events),
+        room_name=room.name,
+        room=room,
+        recorder=SessionRecorder(clock=asyncio.get_running_loop().time),
+    )
+    assert await orchestrator.initialize()
+    await orchestrator.start_interview(orchestrator.session)
+    return orchestrator
+
+
+def _event_types(orchestrator):
+    return [event["type"] for event in orchestrator.recorder.events]
+
+
+def _published_types(orchestrator):
+    return [json.loads(m)["type"] for m in orchestrator.room.local_participant.published]
+
+
+def test_drain_lets_the_interview_run_to_completion():
+    async def scenario():
+        orchestrator = await _start_interview()
+        drain = asyncio.create_task(orchestrator.drain(deadline=600))
+
+        await orchestrator.on_user_speech_committed("A function that captures its scope.")
+        await asyncio.sleep(10)
+        await orchestrator.on_user_speech_committed("Chaining or open addressing.")
+        await drain
+        return orchestrator
+
+    orchestrator = _run(scenario)
+
+    assert _event_types(orchestrator).count("answer") == 2
+    assert "complete" in _event_types(orchestrator)
+    assert "ended_early" not in _event_types(orchestrator)
+    assert "interview_complete" in _published_types(orchestrator)
+
+
+def test_drain_deadline_submits_partial_answer_and_ends_honestly():
+    async def scenario():
+        orchestrator = await _start_interview()
+        await orchestrator.on_user_speech_committed("I think a closure is")
+        # The deadline passes while the candidate is still answering
+        await orchestrator.drain(deadline=2)
+        await asyncio.sleep(60)
+        return orchestrator
+
+    orchestrator = _run(scenario)
+    types = _event_types(orchestrator)
+
+    answer = next(e for e in orchestrator.recorder.events if e["type"] == "answer")
+    assert answer["chars"] == len("I think a closure is")
+    assert types.count("answer") == 1
+    assert types.count("question") == 1
+    assert "complete" not in types
+    ended = next(e for e in orchestrator.recorder.events if e["type"] == "ended_early")
+    assert ended["reason"] == "worker drain deadline reached"
+    assert [e for e in orchestrator.recorder.events if e["type"] == "say"][-1]["text"] == (
+        DRAIN_END_MESSAGE
+    )
+    assert "interview_paused" not in _published_types(orchestrator)
+    assert "interview_complete" not in _published_types(orchestrator)
+
+
+def test_no_questions_are_asked_after_ending_early():
+    async def scenario():
+        orchestrator = await _start_interview()
+        await orchestrator.end_early("test", "Goodbye.")
+        await orchestrator.on_user_speech_committed("A function that captures its scope.")
+        await asyncio.sleep(60)
+        return orchestrator
+
+    orchestrator = _run(scenario)
+
+    assert _event_types(orchestrator).count("question") == 1
+
+
+def test_drain_without_deadline_never_ends_the_interview_early():
+    async def scenario():
+        orchestrator = await _start_interview()
+        drain = asyncio.create_task(orchestrator.drain(deadline=None))
+
+        await asyncio.sleep(3 * 3600)
+        assert not drain.done()
+        await orchestrator.on_user_speech_committed("A function that captures its scope.")
+        await asyncio.sleep(10)
+        await orchestrator.on_user_speech_committed("Chaining or open addressing.")
+        await drain
+        return orchestrator
+
+    orchestrator = _run(scenario)
+
+    assert "ended_early" not in _event_types(orchestrator)
+    assert "complete" in _event_types(orchestrator)
@@ -0,0 +1,88 @@
+import asyncio
+import logging
+import time
+
+from src.loop_monitor import LoopMonitor, TaskRegistry
+
+
+async def test_shutdown_reports_nothing_when_all_tasks_finished():
+    tasks = TaskRegistry("interview-test")
+    await tasks.create_task(asyncio.sleep(0), name="quick")
+
+    assert await tasks.shutdown() == []
+    assert tasks.spawned_count == 1
+    assert tasks.live_count == 0
+
+
+async def test_shutdown_cancels_and_reports_leaked_tasks():
+    tasks = TaskRegistry("interview-test")
+    done = tasks.create_task(asyncio.sleep(0), name="done")
+    leaked = tasks.create_task(asyncio.sleep(3600), name="leaked")
+    await done
+
+    assert await tasks.shutdown() == ["leaked"]
+    assert leaked.cancelled()
+    assert tasks.live_count == 0
+
+
+async def test_shutdown_gives_up_on_tasks_that_ignore_cancellation():
+    tasks = TaskRegistry("interview-test")
+    release = asyncio.Event()
+
+    async def stubborn():
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            await release.wait()
+
+    task = tasks.create_task(stubborn(), name="stubborn")
+    await asyncio.sleep(0)
+
+    assert await tasks.shutdown(timeout=0.01) == ["stubborn"]
+    assert not task.done()
+    release.set()
+    await task
+
+
+def _block_the_loop(seconds: float):
+    time.sleep(seconds)
+
+
+async def test_monitor_reports_a_blocked_loop_once_with_its_stack(caplog):
+    monitor = LoopMonitor(sample_interval=0.05, stall_threshold=0.1, log_interval=3600)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.1)
+        with caplog.at_level(logging.WARNING, logger="src.loop_monitor"):
+            asyncio.get_running_loop().call_soon(_block_the_loop, 0.4)
+            await asyncio.sleep(0.3)
+    finally:
+        await monitor.stop()
+
+    assert monitor.stall_count == 1
+    assert "_block_the_loop" in monitor.last_stall_stack
+    stats = monitor.snapshot()
+    assert stats["stalls"] == 1
+    assert 300 <= stats["lag_ms_max"] < 1000
+    assert stats["lag_ms_avg"] < stats["lag_ms_max"]
+    stall_warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(stall_warnings) == 1
+
+
+async def test_monitor_reports_no_stalls_on_an_idle_loop():
+    monitor = LoopMonitor(sample_interval=0.02, stall_threshold=0.1, log_interval=3600)
+    tasks = TaskRegistry("interview-test")
+    monitor.register(tasks)
+    monitor.start()
+    try:
+        tasks.create_task(asyncio.sleep(3600), name="waiting")
+        await asyncio.sleep(0.2)
+        stats = monitor.snapshot()
+    finally:
+        await monitor.stop()
+        await tasks.shutdown()
+
+    assert monitor.stall_count == 0
+    assert monitor.last_stall_stack is None
+    assert stats["lag_ms_max"] < 100
+    assert stats["tasks_per_room"] == {"interview-test": 1}
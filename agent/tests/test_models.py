@@ -0,0 +1,116 @@
+import json
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from src.api_client import NestJSClient
+from src.models import DEFAULT_DIFFICULTY, DEFAULT_JOB_ROLE, decode_interview
+
+INTERVIEW = {
+    "interview_id": "abc-123",
+    "job_role": "Backend Engineer",
+    "difficulty": "medium",
+    "completed_questions": 0,
+    "status": "in_progress",
+    "questions": [
+        {"id": "q2", "content": "How does a hash map handle collisions?", "order": 2},
+        {"id": "q1", "content": "What is a closure?", "order": 1},
+        {"id": "q3", "content": "Explain database indexes.", "order": 3, "topic": "databases"},
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        INTERVIEW,
+        {"success": True, "data": INTERVIEW},
+        json.dumps(INTERVIEW),
+        json.dumps({"success": True, "data": INTERVIEW}).encode(),
+    ],
+    ids=["dict", "wrapped dict", "str", "wrapped bytes"],
+)
+def test_decodes_wrapped_and_unwrapped_responses(raw):
+    interview = decode_interview(raw)
+
+    assert interview.interview_id == "abc-123"
+    assert interview.job_role == "Backend Engineer"
+    assert [q.id for q in interview.questions] == ["q1", "q2", "q3"]
+
+
+def test_questions_are_sorted_by_order_and_numbered():
+    interview = decode_interview(INTERVIEW)
+
+    assert [q.number for q in interview.questions] == [1, 2, 3]
+    assert interview.questions[0].spoken_text == "Question 1: What is a closure?"
+    assert interview.questions[2].spoken_text == "Question 3: Explain database indexes."
+
+
+def test_questions_without_order_keep_backend_order():
+    data = {**INTERVIEW, "questions": [{"id": "b", "content": "B?"}, {"id": "a", "content": "A?"}]}
+
+    assert [q.id for q in decode_interview(data).questions] == ["b", "a"]
+
+
+@pytest.mark.parametrize("missing", [None, ""])
+def test_missing_job_role_and_difficulty_fall_back_to_defaults(missing):
+    data = {k: v for k, v in INTERVIEW.items() if k not in ("job_role", "difficulty")}
+    if missing is not None:
+        data.update(job_role=missing, difficulty=missing)
+
+    interview = decode_interview(data)
+
+    assert interview.job_role == DEFAULT_JOB_ROLE
+    assert interview.difficulty == DEFAULT_DIFFICULTY
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        b"not json",
+        {**INTERVIEW, "questions": []},
+        {**INTERVIEW, "questions": [{"id": "", "content": "What is a closure?"}]},
+        {**INTERVIEW, "questions": [{"id": "q1", "content": ""}]},
+        {**INTERVIEW, "completed_questions": -1},
+        {"success": True, "data": {"job_role": "Backend Engineer"}},
+        {"success": False, "data": None},
+    ],
+    ids=["not json", "no questions", "empty id", "empty content", "negative count", "wrapped no questions", "wrapped null"],
+)
+def test_malformed_responses_are_rejected(raw):
+    with pytest.raises(ValidationError):
+        decode_interview(raw)
+
+
+def test_to_dict_round_trips():
+    interview = decode_interview(INTERVIEW)
+
+    assert decode_interview(interview.to_dict()) == interview
+
+
+async def _fetch(status_code: int, body: bytes):
+    client = NestJSClient("http://backend")
+    client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(status_code, content=body))
+    )
+    try:
+        return await client.get_interview_details("abc-123", "interview-abc-123")
+    finally:
+        await client.close()
+
+
+async def test_client_returns_decoded_interview():
+    interview = await _fetch(200, json.dumps({"success": True, "data": INTERVIEW}).encode())
+
+    assert interview is not None
+    assert len(interview.questions) == 3
+
+
+@pytest.mark.parametrize(
+    "status_code, body",
+    [(200, json.dumps({"success": True, "data": {"questions": []}}).encode()), (500, b"oops")],
+    ids=["malformed", "server error"],
+)
+async def test_client_returns_none_when_interview_cannot_be_used(status_code, body):
+    assert await _fetch(status_code, body) is None
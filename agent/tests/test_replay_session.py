@@ -0,0 +1,133 @@
+import pytest
+
+from replay_session import WORDS_PER_SECOND, _drop_repeated_speech, run_replay, summarize
+
+QUESTION_1 = "Question 1: What is a closure, and when would you use one in practice?"
+
+
+def _recording(greeting_speech: bool = False):
+    events = [
+        {"t": 0.0, "type": "start", "room": "interview-abc-123"},
+        {
+            "t": 0.2,
+            "type": "interview",
+            "data": {
+                "job_role": "Backend Engineer",
+                "difficulty": "medium",
+                "questions": [
+                    {"id": "q1", "content": "What is a closure, and when would you use one in practice?"},
+                    {"id": "q2", "content": "How does a hash map handle collisions?", "order": 2},
+                ],
+            },
+        },
+        {"t": 10.0, "type": "question", "index": 0},
+        {"t": 10.0, "type": "say", "text": QUESTION_1, "duration": 6.0},
+        # Candidate starts answering 4.5s into the 6s question...
+        {"t": 14.5, "type": "transcript", "index": 0, "text": "A closure is a function that"},
+        {"t": 16.0, "type": "answer_window", "index": 0},
+        # ...and, having been ignored, repeats it once the question ends
+        {"t": 18.0, "type": "transcript", "index": 0, "text": "A closure is a function that captures"},
+        {"t": 21.0, "type": "transcript", "index": 0, "text": "variables from the enclosing scope."},
+        {"t": 25.0, "type": "answer", "index": 0, "chars": 73},
+        {"t": 27.0, "type": "question", "index": 1},
+        {"t": 30.5, "type": "answer_window", "index": 1},
+        {"t": 33.0, "type": "transcript", "index": 1, "text": "Chaining or open addressing."},
+        {"t": 37.0, "type": "answer", "index": 1, "chars": 28},
+        {"t": 45.0, "type": "complete"},
+    ]
+    if greeting_speech:
+        events.insert(2, {"t": 3.0, "type": "transcript", "index": 0, "text": "hi, thanks for having me"})
+    return events
+
+
+def _answer_chars(events):
+    return [e["chars"] for e in events if e["type"] == "answer"]
+
+
+def test_replay_without_early_answers_matches_recorded_turn_lengths():
+    turns = summarize(run_replay(_recording()))["turns"]
+
+    first = turns[0]
+    assert first["answer_window"] - first["asked"] == 6.0
+    assert first["submitted"] - first["answer_window"] == 9.0
+
+
+def test_early_answers_report_time_saved_by_interrupting():
+    baseline = summarize(run_replay(_recording()))
+    early = summarize(run_replay(_recording(), early_answer_capture=True))
+
+    first = early["turns"][0]
+    # The question is interrupted at 4.5s...
+    assert first["answer_window"] - first["asked"] == 4.5
+    # ...and the 6 repeated words of the 7-word utterance after it are not waited for
+    saved = 1.5 + 2.0 * 6 / 7
+    assert baseline["total_seconds"] - early["total_seconds"] == pytest.approx(saved, abs=0.01)
+
+
+def test_early_answers_keep_the_whole_answer_once():
+    events = run_replay(_recording(), early_answer_capture=True)
+
+    answer = "A closure is a function that captures variables from the enclosing scope."
+    assert _answer_chars(events)[0] == len(answer)
+
+
+def test_speech_during_greeting_is_not_part_of_the_first_answer():
+    with_greeting = run_replay(_recording(greeting_speech=True), early_answer_capture=True)
+    without = run_replay(_recording(), early_answer_capture=True)
+
+    assert _answer_chars(with_greeting) == _answer_chars(without)
+
+
+def test_drop_repeated_speech_keeps_new_words_and_moves_the_rest_up():
+    kept = _drop_repeated_speech(
+        "A closure is a function that",
+        [(2.0, "A closure is a function that captures"), (5.0, "variables from the scope.")],
+    )
+
+    shift = 2.0 * 6 / 7
+    assert [text for _, text in kept] == ["captures", "variables from the scope."]
+    assert [offset for offset, _ in kept] == pytest.approx([2.0 - shift, 5.0 - shift])
+
+
+def test_drop_repeated_speech_drops_fully_repeated_utterances():
+    kept = _drop_repeated_speech(
+        "A closure is a function",
+        [(2.0, "A closure is a function."), (5.0, "It captures the scope.")],
+    )
+    assert kept == [(3.0, "It captures the scope.")]
+
+
+def test_drop_repeated_speech_keeps_new_speech():
+    after = [(2.0, "Something else entirely."), (5.0, "A closure is a function")]
+    assert _drop_repeated_speech("A closure is a function", after) == after
+
+
+def _recorded_question_say(**flags):
+    events = _recording()
+    say = next(e for e in events if e["type"] == "say")
+    say.update(duration=4.5, **flags)
+    return events
+
+
+def test_interrupted_playout_is_not_reused_as_question_length():
+    events = _recorded_question_say(interruptible=True, interrupted=True)
+
+    first = summarize(run_replay(events))["turns"][0]
+    # Played for the word-rate estimate, not the 4.5s it ran before being interrupted
+    assert first["answer_window"] - first["asked"] == pytest.approx(
+        len(QUESTION_1.split()) / WORDS_PER_SECOND
+    )
+
+
+def test_interruptible_playout_that_finished_is_reused():
+    events = _recorded_question_say(interruptible=True, interrupted=False)
+
+    first = summarize(run_replay(events))["turns"][0]
+    assert first["answer_window"] - first["asked"] == 4.5
+
+
+def test_replay_records_whether_the_question_was_interrupted():
+    says = [e for e in run_replay(_recording(), early_answer_capture=True) if e["type"] == "say"]
+
+    question = next(e for e in says if e["text"] == QUESTION_1)
+    assert question["interruptible"] and question["interrupted"]
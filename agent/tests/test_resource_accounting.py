@@ -0,0 +1,89 @@
+import asyncio
+import importlib
+import tracemalloc
+
+import pytest
+
+from src.loop_monitor import TaskRegistry
+from src.resource_accounting import SessionResources
+
+REQUIRED_ENV = ("LIVEKIT_URL", "LIVEKIT_API_KEY", "LIVEKIT_API_SECRET", "GOOGLE_API_KEY", "NESTJS_API_URL")
+
+
+def _resources(**limits) -> SessionResources:
+    return SessionResources(TaskRegistry("interview-test"), **limits)
+
+
+def test_each_exceeded_limit_is_reported_once():
+    resources = _resources(max_transcript_bytes=10, max_data_bytes=100)
+
+    resources.add_transcript("short")
+    assert resources.check() == []
+
+    resources.add_transcript("a longer transcript")
+    assert resources.check() == ["transcript_bytes 24 > 10"]
+    resources.add_data_message(500)
+    assert resources.check() == ["data_bytes 500 > 100"]
+    assert resources.check() == []
+
+
+def test_limits_set_to_none_are_not_checked():
+    resources = _resources(max_transcript_bytes=None, max_data_bytes=None, max_tasks=None)
+
+    resources.add_transcript("x" * 10_000)
+    resources.add_data_message(10_000_000)
+
+    assert resources.check() == []
+
+
+async def test_live_tasks_limit():
+    tasks = TaskRegistry("interview-test")
+    resources = SessionResources(tasks, max_tasks=1)
+    tasks.create_task(asyncio.sleep(3600), name="one")
+    assert resources.check() == []
+
+    tasks.create_task(asyncio.sleep(3600), name="two")
+    assert resources.check() == ["tasks 2 > 1"]
+    await tasks.shutdown()
+
+
+def test_allocation_growth_limit_when_tracing():
+    was_tracing = tracemalloc.is_tracing()
+    tracemalloc.start()
+    try:
+        resources = _resources(max_allocated_mb=1, track_allocations=True)
+        resources._baseline_traced = tracemalloc.get_traced_memory()[0]
+        held = bytearray(2 * 1024 * 1024)
+
+        exceeded = resources.check()
+        assert len(exceeded) == 1 and exceeded[0].startswith("allocated_bytes ")
+        del held
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+
+def test_allocation_limit_is_ignored_without_tracing():
+    resources = _resources(max_allocated_mb=0.001, track_allocations=False)
+
+    assert resources.allocated_bytes is None
+    assert resources.check() == []
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [(None, 100), ("", None), ("0", None), ("250", 250), ("not a number", 100)],
+)
+def test_session_limits_can_be_disabled_with_zero_or_empty(monkeypatch, raw, expected):
+    for key in REQUIRED_ENV:
+        monkeypatch.setenv(key, "test")
+    if raw is None:
+        monkeypatch.delenv("SESSION_MAX_TASKS", raising=False)
+    else:
+        monkeypatch.setenv("SESSION_MAX_TASKS", raw)
+    monkeypatch.setenv("SESSION_MAX_ALLOCATED_MB", "0")
+
+    config = importlib.import_module("src.config").Config()
+
+    assert config.session_max_tasks == expected
+    assert config.session_max_allocated_mb is None
@@ -0,0 +1,81 @@
+from src.session_recorder import SessionRecorder, compute_turn_timings, load_events
+
+
+def _events():
+    return [
+        {"t": 0.0, "type": "start", "room": "interview-test"},
+        {"t": 2.0, "type": "transcript", "index": 0, "text": "hi there"},
+        {"t": 10.0, "type": "question", "index": 0},
+        {"t": 16.0, "type": "answer_window", "index": 0},
+        {"t": 18.0, "type": "transcript", "index": 0, "text": "first part"},
+        {"t": 25.0, "type": "transcript", "index": 0, "text": "second part"},
+        {"t": 29.5, "type": "answer", "index": 0, "chars": 22},
+        {"t": 31.0, "type": "question", "index": 1},
+        {"t": 36.0, "type": "answer_window", "index": 1},
+        {"t": 40.0, "type": "transcript", "index": 1, "text": "only part"},
+        {"t": 44.0, "type": "answer", "index": 1, "chars": 9},
+        {"t": 50.0, "type": "complete"},
+    ]
+
+
+def test_turn_timings_per_question():
+    first, second = compute_turn_timings(_events())
+
+    assert first == {
+        "index": 0,
+        "asked": 10.0,
+        "answer_window": 16.0,
+        "first_speech": 18.0,
+        "last_speech": 25.0,
+        "submitted": 29.5,
+        "ended": 31.0,
+        "response_delay": 4.5,
+        "duration": 21.0,
+    }
+    assert second["ended"] == 50.0
+    assert second["response_delay"] == 4.0
+    assert second["duration"] == 19.0
+
+
+def test_speech_before_a_question_is_asked_is_ignored():
+    first = compute_turn_timings(_events())[0]
+    assert first["first_speech"] == 18.0
+
+
+def test_unfinished_session_has_no_last_duration():
+    events = [e for e in _events() if e["type"] != "complete"]
+    last = compute_turn_timings(events)[-1]
+
+    assert last["ended"] is None
+    assert "duration" not in last
+
+
+def test_unanswered_question_has_no_response_delay():
+    events = [e for e in _events() if not (e["type"] == "answer" and e["index"] == 1)]
+    last = compute_turn_timings(events)[-1]
+
+    assert "submitted" not in last
+    assert "response_delay" not in last
+
+
+def test_recording_round_trip(tmp_path):
+    now = [100.0]
+    recorder = SessionRecorder(path=tmp_path / "rec.jsonl", clock=lambda: now[0])
+    recorder.record("question", index=0)
+    now[0] = 101.5
+    recorder.record("answer_window", index=0)
+    recorder.close()
+
+    assert load_events(tmp_path / "rec.jsonl") == [
+        {"t": 0.0, "type": "question", "index": 0},
+        {"t": 1.5, "type": "answer_window", "index": 0},
+    ]
+
+
+def test_disabled_recorder_writes_nothing(tmp_path):
+    recorder = SessionRecorder(path=tmp_path / "rec.jsonl", enabled=False)
+    recorder.record("question", index=0)
+    recorder.close()
+
+    assert recorder.events == []
+    assert not (tmp_path / "rec.jsonl").exists()
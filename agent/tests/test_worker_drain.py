@@ -0,0 +1,78 @@
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.worker_drain import install_drain_forwarding, on_worker_drain
+
+AGENT_DIR = Path(__file__).resolve().parent.parent
+
+# A job process as LiveKit starts it: SIGTERM ignored until the entrypoint listens
+JOB_PROCESS = textwrap.dedent(
+    """
+    import asyncio, signal
+    from src.worker_drain import on_worker_drain
+
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+    async def main():
+        drained = asyncio.Event()
+        on_worker_drain(drained.set)
+        print("ready", flush=True)
+        await asyncio.wait_for(drained.wait(), 10)
+        print("drained", flush=True)
+
+    asyncio.run(main())
+    """
+)
+
+
+def _fake_server(procs):
+    return SimpleNamespace(_proc_pool=SimpleNamespace(processes=procs), active_jobs=[])
+
+
+async def test_sigterm_is_forwarded_to_running_jobs_before_livekit_handler():
+    job = subprocess.Popen(
+        [sys.executable, "-c", JOB_PROCESS], cwd=AGENT_DIR, stdout=subprocess.PIPE, text=True
+    )
+    idle = SimpleNamespace(pid=job.pid + 1_000_000, running_job=None)
+    running = SimpleNamespace(pid=job.pid, running_job=object())
+
+    calls = []
+    original = signal.signal(signal.SIGTERM, lambda signum, frame: calls.append("livekit"))
+    try:
+        assert job.stdout.readline().strip() == "ready"
+        install_drain_forwarding(
+            _fake_server([idle, running]), on_drain=lambda: calls.append("readiness")
+        )
+
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.sleep(0)
+
+        assert calls == ["readiness", "livekit"]
+        assert await asyncio.to_thread(job.stdout.readline) == "drained\n"
+        # A second SIGTERM goes straight to LiveKit's handler
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.sleep(0)
+        assert calls == ["readiness", "livekit", "livekit"]
+    finally:
+        signal.signal(signal.SIGTERM, original)
+        job.kill()
+        job.wait()
+
+
+async def test_jobs_on_threads_are_notified_on_their_own_loop():
+    drained = asyncio.Event()
+    stop_listening = on_worker_drain(drained.set, in_process=False)
+    original = signal.signal(signal.SIGTERM, lambda signum, frame: None)
+    try:
+        install_drain_forwarding(_fake_server([]))
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.wait_for(drained.wait(), 1)
+    finally:
+        signal.signal(signal.SIGTERM, original)
+        stop_listening()